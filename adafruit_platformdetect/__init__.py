@@ -6,47 +6,217 @@
 Attempt to detect the current platform.
 """
 import os
-import re
 import sys
 
 try:
-    from typing import Optional
+    from typing import Any, Callable, Dict, List, Mapping, Optional, Union
 except ImportError:
     pass
 
-from adafruit_platformdetect.board import Board
-from adafruit_platformdetect.chip import Chip
+from adafruit_platformdetect.cpuinfo import CpuInfo
+from adafruit_platformdetect.devicetree import DeviceTreeCompatible
+from adafruit_platformdetect.sysroot import LocalFilesystem
 
 # Needed to find libs (like libusb) installed by homebrew on Apple Silicon
 if sys.platform == "darwin":
     os.environ["DYLD_FALLBACK_LIBRARY_PATH"] = "/opt/homebrew/lib/"
 
 
+def __getattr__(name: str) -> Any:
+    """Import Board and Chip on first use, see :class:`Detector`."""
+    if name == "Board":
+        from adafruit_platformdetect.board import Board
+
+        return Board
+    if name == "Chip":
+        from adafruit_platformdetect.chip import Chip
+
+        return Chip
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 # Various methods here may retain state in future, so tell pylint not to worry
 # that they don't use self right now:
 # pylint: disable=no-self-use
-class Detector:
-    """Wrap various platform detection functions."""
+class Detector:  # pylint: disable=too-many-instance-attributes
+    """Wrap various platform detection functions.
+
+    ``root`` selects where system files are read from: None for the running
+    system, a directory holding a copy of a system's files, or a backend
+    object such as :class:`adafruit_platformdetect.sysroot.MemoryFilesystem`.
+    Anything other than the running system is detected as a Linux host.
+    ``environ`` replaces :data:`os.environ` for the ``BLINKA_*`` settings.
+    With ``io_stats`` set, every file read is counted, see :meth:`io_stats`.
+    With ``strict`` set, ``board.<NAME>`` and ``chip.<NAME>`` raise
+    :class:`AttributeError` for a name that is not a board or chip constant,
+    instead of returning ``False``.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        cache_path: Optional[str] = None,
+        root: Union[str, Any, None] = None,
+        environ: Optional[Mapping[str, str]] = None,
+        io_stats: bool = False,
+        strict: bool = False,
+    ) -> None:
+        # Imported here so that importing only the constants, as Blinka
+        # does, does not load the detection code
+        from adafruit_platformdetect.board import Board
+        from adafruit_platformdetect.chip import Chip
 
-    def __init__(self) -> None:
         self.board = Board(self)
         self.chip = Chip(self)
+        self._cpuinfo = None
+        self._dt_compatible = None
+        self._usb_devices = None
+        self.tracer = None
+        self.strict = strict
+
+        if root is None or isinstance(root, str):
+            root = LocalFilesystem(root or "/")
+        self.sysroot = root
+        self._io_stats = None
+        if io_stats:
+            from adafruit_platformdetect.iostats import CountingFilesystem, IOStats
+
+            self._io_stats = IOStats()
+            self.sysroot = CountingFilesystem(root, self._io_stats)
+        self.platform = sys.platform if root.live else "linux"
+        if environ is None:
+            environ = getattr(os, "environ", None)
+            live = root.live and environ is not None
+        else:
+            live = False
+        self.environ = environ
+
+        # Opt-in cache of results shared by every process of this boot, only
+        # used when detecting the live system
+        if cache_path is None and live:
+            cache_path = self.environ.get("BLINKA_DETECTION_CACHE")
+        self.cache = None
+        if cache_path and live:
+            from adafruit_platformdetect.cache import DetectionCache
+
+            self.cache = DetectionCache(cache_path)
+
+    def invalidate(self) -> None:
+        """
+        Forget every cached detection result and file snapshot. The next
+        access to ``chip.id``, ``board.id`` or any board property probes the
+        system again.
+        """
+        self._cpuinfo = None
+        self._dt_compatible = None
+        self._usb_devices = None
+        self.chip.invalidate()
+        self.board.invalidate()
+        if self.cache is not None:
+            self.cache.invalidate()
+
+    def refresh(self) -> None:
+        """
+        Re-run detection now, for long running processes that expect the
+        hardware (for example a USB adapter) to have changed.
+        """
+        self.invalidate()
+        _ = self.board.id
+
+    def explain(self) -> List[Dict[str, Any]]:
+        """
+        Detect the board again with tracing enabled and return the ordered
+        events: each rule evaluated, its input, its result and the time it
+        took. See :mod:`adafruit_platformdetect.trace`. The persistent cache
+        is bypassed, so every rule that decides the result is shown.
+        """
+        from adafruit_platformdetect.trace import Tracer, TracingFilesystem
+
+        tracer = Tracer()
+        backend, cache = self.sysroot, self.cache
+        self.sysroot = TracingFilesystem(backend, tracer)
+        self.tracer = tracer
+        self.cache = None
+        self._cpuinfo = None
+        self._dt_compatible = None
+        self._usb_devices = None
+        self.chip.invalidate()
+        self.board.invalidate()
+        try:
+            _ = self.board.id
+        finally:
+            self.sysroot, self.cache, self.tracer = backend, cache, None
+        return tracer.events
+
+    def collect_io_stats(self) -> Any:
+        """
+        Return a context manager that counts the file reads made while it is
+        active. Entering it returns the
+        :class:`~adafruit_platformdetect.iostats.IOStats` being filled in,
+        which is also what :meth:`io_stats` reports from then on.
+        """
+        from adafruit_platformdetect.iostats import IOStatsCollector
+
+        collector = IOStatsCollector(self)
+        self._io_stats = collector.stats
+        return collector
+
+    def io_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Return the opens, missing files, bytes read and time in nanoseconds of
+        each path read during the latest :meth:`collect_io_stats`, or since
+        construction with ``io_stats=True``. Empty if neither was used.
+        """
+        if self._io_stats is None:
+            return {}
+        return self._io_stats.as_dict()
+
+    def cached_result(self, name: str, detect: Callable[[], Any]) -> Any:
+        """
+        Return the result ``detect()`` computes for ``name``, taking it from
+        the persistent detection cache when one is configured and still
+        valid, and storing it there otherwise.
+        """
+        if self.cache is None or not self.cache.enabled:
+            return detect()
+        if name in self.cache:
+            return self.cache[name]
+        value = detect()
+        self.cache[name] = value
+        return value
 
     def get_cpuinfo_field(self, field: str) -> Optional[str]:
         """
         Search /proc/cpuinfo for a field and return its value, if found,
         otherwise None.
         """
-        # Match a line like 'Hardware   : BCM2709':
-        pattern = r"^" + field + r"\s+:\s+(.*)$"
+        if self.tracer is None:
+            return self.get_cpuinfo().get(field)
+        start = self.tracer.now()
+        value = self.get_cpuinfo().get(field)
+        self.tracer.record("cpuinfo", field, value, start)
+        return value
 
-        with open("/proc/cpuinfo", "r", encoding="utf-8") as infile:
-            cpuinfo = infile.read().split("\n")
-        for line in cpuinfo:
-            match = re.search(pattern, line, flags=re.IGNORECASE)
-            if match:
-                return match.group(1)
-        return None
+    def get_cpuinfo(self) -> CpuInfo:
+        """
+        Return the parsed contents of /proc/cpuinfo. The file is only read and
+        indexed the first time, later calls share the same index.
+        """
+        if self._cpuinfo is None:
+            self._cpuinfo = CpuInfo(self.sysroot.read_text("/proc/cpuinfo"))
+        return self._cpuinfo
+
+    def get_usb_devices(self) -> "UsbDevices":
+        """
+        Return the USB devices attached to the host, read from the sysfs of
+        the sysroot where it has one. Each kind of device is only enumerated
+        the first time it is needed, later calls share the same result until
+        :meth:`invalidate`.
+        """
+        if self._usb_devices is None:
+            from adafruit_platformdetect.usbdevices import UsbDevices
+
+            self._usb_devices = UsbDevices(self.sysroot)
+        return self._usb_devices
 
     def check_dt_compatible_value(self, value: str) -> bool:
         """
@@ -54,27 +224,24 @@ class Detector:
         otherwise False.
         """
         # Match a value like 'qcom,apq8016-sbc':
-        dt_compatible = self.get_device_compatible()
-        if dt_compatible and value in dt_compatible:
-            return True
-
-        return False
+        return value in self.get_dt_compatible()
 
     def get_armbian_release_field(self, field: str) -> Optional[str]:
         """
         Search /etc/armbian-release, if it exists, for a field and return its
         value, if found, otherwise None.
         """
+        import re
+
         field_value = None
 
         pattern = r"^" + field + r"=(.*)"
         try:
-            with open("/etc/armbian-release", "r", encoding="utf-8") as release_file:
-                armbian = release_file.read().split("\n")
-                for line in armbian:
-                    match = re.search(pattern, line)
-                    if match:
-                        field_value = match.group(1)
+            armbian = self.sysroot.read_text("/etc/armbian-release").split("\n")
+            for line in armbian:
+                match = re.search(pattern, line)
+                if match:
+                    field_value = match.group(1)
         except FileNotFoundError:
             pass
 
@@ -86,8 +253,7 @@ class Detector:
         otherwise None.
         """
         try:
-            with open("/proc/device-tree/model", "r", encoding="utf-8") as model_file:
-                return model_file.read()
+            return self.sysroot.read_text("/proc/device-tree/model")
         except FileNotFoundError:
             pass
         return None
@@ -96,14 +262,20 @@ class Detector:
         """
         Search /proc/device-tree/compatible for the compatible chip name.
         """
-        try:
-            with open(
-                "/proc/device-tree/compatible", "r", encoding="utf-8"
-            ) as model_file:
-                return model_file.read()
-        except FileNotFoundError:
-            pass
-        return None
+        return self.get_dt_compatible().text
+
+    def get_dt_compatible(self) -> DeviceTreeCompatible:
+        """
+        Return the parsed contents of /proc/device-tree/compatible. The file is
+        only read the first time, later calls share the same snapshot.
+        """
+        if self._dt_compatible is None:
+            try:
+                raw = self.sysroot.read_bytes("/proc/device-tree/compatible")
+            except FileNotFoundError:
+                raw = None
+            self._dt_compatible = DeviceTreeCompatible(raw)
+        return self._dt_compatible
 
     def check_board_asset_tag_value(self) -> Optional[str]:
         """
@@ -111,10 +283,8 @@ class Detector:
         otherwise None.
         """
         try:
-            with open(
-                "/sys/devices/virtual/dmi/id/board_asset_tag", "r", encoding="utf-8"
-            ) as tag_file:
-                return tag_file.read().strip()
+            tag = self.sysroot.read_text("/sys/devices/virtual/dmi/id/board_asset_tag")
+            return tag.strip()
         except FileNotFoundError:
             pass
         return None
@@ -125,10 +295,8 @@ class Detector:
         otherwise None. Debian/ubuntu based
         """
         try:
-            with open(
-                "/sys/devices/virtual/dmi/id/board_name", "r", encoding="utf-8"
-            ) as board_name_file:
-                return board_name_file.read().strip()
+            name = self.sysroot.read_text("/sys/devices/virtual/dmi/id/board_name")
+            return name.strip()
         except FileNotFoundError:
             pass
         return None
@@ -0,0 +1,172 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_platformdetect.batch`
+================================================================================
+
+Offline classification of many captured snapshots
+
+Snapshots written by :mod:`adafruit_platformdetect.snapshot` are read either
+from a directory, one snapshot file each, or from a JSONL file holding one
+:meth:`~adafruit_platformdetect.snapshot.Snapshot.to_dict` object per line
+with an optional ``"id"`` key. They are classified across a process pool and
+the results come back in input order:
+
+.. code-block:: python
+
+    from adafruit_platformdetect.batch import classify_source
+
+    for result in classify_source("snapshots/"):
+        print(result["id"], result["board_id"])
+
+Inputs are read lazily and only a bounded number of chunks is in flight at
+any time, so memory use does not grow with the size of the corpus.
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Linux and Python 3.7 or Higher
+
+"""
+
+import collections
+import json
+import os
+import sys
+
+try:
+    from typing import (
+        Any,
+        Deque,
+        Dict,
+        Iterable,
+        Iterator,
+        List,
+        Optional,
+        Tuple,
+        Union,
+    )
+except ImportError:
+    pass
+
+from adafruit_platformdetect.snapshot import Snapshot
+
+# Snapshot files are gzip compressed, JSONL lines are plain JSON
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+def classify(snapshot: Snapshot) -> Dict[str, Any]:
+    """Return the chip id, board id, Pi revision code and board families."""
+    detector = snapshot.detector()
+    board = detector.board
+    return {
+        "chip_id": detector.chip.id,
+        "board_id": board.id,
+        "rev_code": board.rev_code,
+        "families": sorted(board.families),
+    }
+
+
+def _classify_item(name: str, payload: Union[bytes, str]) -> Dict[str, Any]:
+    result = {"id": name}  # type: Dict[str, Any]
+    try:
+        if payload[:2] == _GZIP_MAGIC:
+            snapshot = Snapshot.loads(payload)
+        else:
+            data = json.loads(payload)
+            if "id" in data:
+                result["id"] = str(data["id"])
+            snapshot = Snapshot.from_dict(data)
+        result.update(classify(snapshot))
+    except Exception as error:  # pylint: disable=broad-except
+        # One bad snapshot must not stop a run over thousands of them
+        result["error"] = "{}: {}".format(type(error).__name__, error)
+    return result
+
+
+def _classify_chunk(items: List[Tuple[str, Any]]) -> List[Dict[str, Any]]:
+    return [_classify_item(name, payload) for name, payload in items]
+
+
+def iter_directory(path: str) -> Iterator[Tuple[str, bytes]]:
+    """Yield ``(file name, contents)`` for each snapshot file in ``path``."""
+    names = sorted(entry.name for entry in os.scandir(path) if entry.is_file())
+    for name in names:
+        with open(os.path.join(path, name), "rb") as snapshot_file:
+            yield name, snapshot_file.read()
+
+
+def iter_jsonl(lines: Iterable[str]) -> Iterator[Tuple[str, str]]:
+    """Yield ``(line number, line)`` for each non-empty line of JSONL.
+
+    Lines are parsed by the workers, which report an ``"id"`` found in the
+    data instead of the line number.
+    """
+    for number, line in enumerate(lines, 1):
+        if line.strip():
+            yield str(number), line
+
+
+def iter_source(source: str) -> Iterator[Tuple[str, Any]]:
+    """Yield the snapshots of a directory, a JSONL file or ``-`` for stdin."""
+    if source == "-":
+        yield from iter_jsonl(sys.stdin)
+    elif os.path.isdir(source):
+        yield from iter_directory(source)
+    else:
+        with open(source, "r", encoding="utf-8") as jsonl_file:
+            yield from iter_jsonl(jsonl_file)
+
+
+def _chunks(
+    items: Iterable[Tuple[str, Any]], size: int
+) -> Iterator[List[Tuple[str, Any]]]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def classify_all(
+    items: Iterable[Tuple[str, Any]],
+    processes: Optional[int] = None,
+    chunksize: int = 64,
+) -> Iterator[Dict[str, Any]]:
+    """Classify ``(id, snapshot)`` pairs, yielding results in input order.
+
+    ``processes`` defaults to the number of CPUs; 1 classifies in this
+    process without a pool.
+    """
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if processes <= 1:
+        for chunk in _chunks(items, chunksize):
+            yield from _classify_chunk(chunk)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        pending = collections.deque()  # type: Deque[Any]
+        for chunk in _chunks(items, chunksize):
+            pending.append(executor.submit(_classify_chunk, chunk))
+            # Enough queued to keep every worker busy, but no more
+            if len(pending) >= processes * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def classify_source(
+    source: str, processes: Optional[int] = None, chunksize: int = 64
+) -> Iterator[Dict[str, Any]]:
+    """Classify every snapshot of a directory, JSONL file or ``-`` for stdin."""
+    return classify_all(iter_source(source), processes, chunksize)
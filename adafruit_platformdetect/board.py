@@ -21,15 +21,10 @@ Implementation Notes
 
 """
 
-try:
-    import glob
-except ImportError:
-    pass
 import os
-import re
 
 try:
-    from typing import Optional
+    from typing import Dict, FrozenSet, Iterable, Optional
 except ImportError:
     pass
 
@@ -38,238 +33,288 @@ from adafruit_platformdetect.constants import boards, chips
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_PlatformDetect.git"
 
+# Marks a cache slot that has not been filled yet, so a detected None is cached
+_UNSET = object()
+
+# pylint: disable=protected-access
+# Board ids of each family, named after the Board.any_* property testing it.
+# "raspberry_pi" is missing as it is decided by the Pi revision code instead.
+_BOARD_FAMILIES = {
+    "96boards": boards._LINARO_96BOARDS_IDS,
+    "ameridroid": boards._AMERIDROID_IDS,
+    "asus_tinker_board": boards._ASUS_TINKER_BOARD_IDS,
+    "bananapi": boards._BANANA_PI_IDS,
+    "beaglebone": boards._BEAGLEBONE_IDS,
+    "clockwork_pi_board": (boards.CLOCKWORK_CPI3,),
+    "coral_board": boards._CORAL_IDS,
+    "giant_board": (boards.GIANT_BOARD,),
+    "horizon_board": boards._HORIZON_IDS,
+    "jetson_board": tuple(v[0] for v in boards._JETSON_IDS),
+    "khadas_vim3_40_pin": boards._KHADAS_40_PIN_IDS,
+    "lemaker": boards._LEMAKER_IDS,
+    "libre_computer_board": boards._LIBRE_COMPUTER_IDS,
+    "lichee_riscv_board": boards._LICHEE_RISCV_IDS,
+    "lubancat": boards._LUBANCAT_IDS,
+    "luckfox_pico_board": boards._LUCKFOX_IDS,
+    "maaxboard": boards._MAAXBOARD_IDS,
+    "milkv_board": boards._MILKV_IDS_,
+    "nanopi": boards._NANOPI_IDS,
+    "nxp_navq_board": boards._NXP_SOM_IDS,
+    "odroid_40_pin": boards._ODROID_40_PIN_IDS,
+    "odroid_mini_pc": boards._ODROID_MINI_PC_IDS,
+    "olimex_board": boards._OLIMEX_IDS,
+    "onion_omega_board": boards._ONION_OMEGA_BOARD_IDS,
+    "orange_pi": boards._ORANGE_PI_IDS,
+    "particle_board": boards._PARTICLE_IDS,
+    "pcduino_board": boards._PCDUINO_DEV_IDS,
+    "pine64_board": boards._PINE64_DEV_IDS,
+    "pynq_board": boards._PYNQ_IDS,
+    "raspberry_pi_40_pin": boards._RASPBERRY_PI_40_PIN_IDS,
+    "raspberry_pi_4_board": boards._RASPBERRY_PI_4_IDS,
+    "raspberry_pi_5_board": boards._RASPBERRY_PI_5_IDS,
+    "raspberry_pi_cm": boards._RASPBERRY_PI_CM_IDS,
+    "raspberry_pi_pico_id": boards._RASPBERRY_PI_PICO_IDS,
+    "repka_board": boards._REPKA_PI_IDS,
+    "rock_pi_board": boards._ROCK_PI_IDS,
+    "seeed_board": boards._SEEED_BOARD_IDS,
+    "siemens_simatic_iot2000": boards._SIEMENS_SIMATIC_IOT2000_IDS,
+    "sifive_board": boards._SIFIVE_IDS,
+    "starfive_id": boards._STARFIVE_BOARD_IDS,
+    "stm32mp1": boards._STM32MP1_IDS,
+    "tisk_board": tuple(v[0] for v in boards._TI_SK_BOARD_IDS),
+    "udoo_board": tuple(boards._UDOO_BOARD_IDS),
+    "vicharak_board": boards._VICHARAK_BOARD_IDS,
+    "vivid_unit": boards._VIVID_UNIT_IDS,
+    "walnutpi": boards._WALNUT_PI_IDS,
+}  # type: Dict[str, Iterable[str]]
+# pylint: enable=protected-access
+
+
+def _families_by_id() -> Dict[str, FrozenSet[str]]:
+    by_id = {}  # type: Dict[str, set]
+    for family, board_ids in _BOARD_FAMILIES.items():
+        for board_id in board_ids:
+            by_id.setdefault(board_id, set()).add(family)
+    # Boards of the same families share one frozenset: about 50 of them
+    # stand for the families of some 180 boards
+    shared = {}  # type: Dict[FrozenSet[str], FrozenSet[str]]
+    result = {}
+    for board_id, families in by_id.items():
+        families = frozenset(families)
+        result[board_id] = shared.setdefault(families, families)
+    return result
+
+
+# Board id to the names of the families it belongs to
+_FAMILIES_BY_ID = _families_by_id()
+
+
+_NO_FAMILIES = frozenset()  # type: FrozenSet[str]
+_RASPBERRY_PI_FAMILY = frozenset(("raspberry_pi",))
+
+# Every name Board.families can hold
+FAMILY_NAMES = frozenset(_BOARD_FAMILIES) | _RASPBERRY_PI_FAMILY
+
+# Families of the boards Board.any_embedded_linux is true for, besides a
+# Raspberry Pi found by its revision code
+_EMBEDDED_LINUX_FAMILIES = (
+    "96boards",
+    "ameridroid",
+    "asus_tinker_board",
+    "bananapi",
+    "beaglebone",
+    "clockwork_pi_board",
+    "coral_board",
+    "giant_board",
+    "horizon_board",
+    "jetson_board",
+    "khadas_vim3_40_pin",
+    "lemaker",
+    "libre_computer_board",
+    "lichee_riscv_board",
+    "lubancat",
+    "luckfox_pico_board",
+    "maaxboard",
+    "milkv_board",
+    "nanopi",
+    "nxp_navq_board",
+    "odroid_40_pin",
+    "odroid_mini_pc",
+    "olimex_board",
+    "onion_omega_board",
+    "orange_pi",
+    "particle_board",
+    "pcduino_board",
+    "pine64_board",
+    "pynq_board",
+    "raspberry_pi_40_pin",
+    "repka_board",
+    "rock_pi_board",
+    "seeed_board",
+    "siemens_simatic_iot2000",
+    "sifive_board",
+    "starfive_id",
+    "stm32mp1",
+    "tisk_board",
+    "udoo_board",
+    "vivid_unit",
+    "walnutpi",
+)
+
+_EMBEDDED_LINUX_IDS = frozenset(
+    [boards.GENERIC_LINUX_PC]
+    + [
+        board_id
+        for family in _EMBEDDED_LINUX_FAMILIES
+        for board_id in _BOARD_FAMILIES[family]
+    ]
+)
+
+# Boards only ever chosen through BLINKA_* environment variables
+_OS_ENVIRON_BOARD_IDS = frozenset(
+    (
+        boards.FTDI_FT232H,
+        boards.FTDI_FT2232H,
+        boards.FTDI_FT4232H,
+        boards.MICROCHIP_MCP2221,
+        boards.BINHO_NOVA,
+        boards.GREATFET_ONE,
+        boards.PICO_U2IF,
+        boards.FEATHER_U2IF,
+        boards.FEATHER_CAN_U2IF,
+        boards.FEATHER_EPD_U2IF,
+        boards.FEATHER_RFM_U2IF,
+        boards.ITSYBITSY_U2IF,
+        boards.MACROPAD_U2IF,
+        boards.QTPY_U2IF,
+        boards.QT2040_TRINKEY_U2IF,
+        boards.KB2040_U2IF,
+        boards.RP2040_ONE_U2IF,
+        boards.RADXA_X4_U2IF,
+        boards.OS_AGNOSTIC_BOARD,
+    )
+)
+
+# Every name board.<NAME> is expected to be asked about: the board constants
+# and the board ids they stand for
+_BOARD_NAMES = frozenset(
+    name
+    for constant, value in vars(boards).items()
+    if constant.isupper() and isinstance(value, str)
+    for name in (constant, value)
+)
+
 
 class Board:
     """Attempt to detect specific boards."""
 
     def __init__(self, detector) -> None:
         self.detector = detector
-        self._board_id = None
+        self._board_id = _UNSET
+        self._rev_code = _UNSET
+        self._families = _UNSET
+        self._flag_names = ()  # type: Iterable[str]
 
     # pylint: disable=invalid-name, protected-access, too-many-return-statements, too-many-lines
     @property
     def id(self) -> Optional[str]:
         """Return a unique id for the detected board, if any."""
-        # There are some times we want to trick the platform detection
-        # say if a raspberry pi doesn't have the right ID, or for testing
-
-        # Caching
-        if self._board_id:
+        # Caching, including a previous "nothing found"
+        if self._board_id is not _UNSET:
             return self._board_id
 
+        tracer = self.detector.tracer
+        if tracer is None:
+            return self._find_id()
+        start = tracer.now()
+        board_id = self._find_id()
+        environ = self.detector.environ
+        if environ is not None and "BLINKA_FORCEBOARD" in environ:
+            source = "BLINKA_FORCEBOARD"
+        else:
+            source = "chip {}".format(self.detector.chip.id)
+        tracer.record("board.id", source, board_id, start)
+        return board_id
+
+    # pylint: enable=invalid-name
+
+    def _find_id(self) -> Optional[str]:
+        # There are some times we want to trick the platform detection
+        # say if a raspberry pi doesn't have the right ID, or for testing
+        tracer = self.detector.tracer
+        if tracer is not None:
+            start = tracer.now()
         try:
-            return os.environ["BLINKA_FORCEBOARD"]
-        except (AttributeError, KeyError):  # no forced board, continue with testing!
+            board_id = self.detector.environ["BLINKA_FORCEBOARD"]
+        except (TypeError, KeyError):  # no forced board, continue with testing!
             pass
+        else:
+            if tracer is not None:
+                tracer.record("environ", "BLINKA_FORCEBOARD", board_id, start)
+            return board_id
 
+        self._board_id = self.detector.cached_result("board_id", self._resolve)
+        return self._board_id
+
+    def _resolve(self) -> Optional[str]:
+        """Run the resolvers registered for the detected chip."""
+        tracer = self.detector.tracer
         chip_id = self.detector.chip.id
         board_id = None
-
-        if chip_id == chips.H3:
-            board_id = self._armbian_id() or self._allwinner_variants_id()
-        elif chip_id == chips.JH7110:
-            board_id = self._starfive_id()
-        elif chip_id == chips.BCM2XXX:
-            board_id = self._pi_id()
-        elif chip_id == chips.OS_AGNOSTIC:
-            board_id = boards.OS_AGNOSTIC_BOARD
-        elif chip_id == chips.AM625X:
-            board_id = self._beaglebone_id()
-        elif chip_id == chips.AM33XX:
-            board_id = self._beaglebone_id()
-        elif chip_id == chips.AM65XX:
-            board_id = self._siemens_simatic_iot2000_id()
-        elif chip_id == chips.AM67A:
-            board_id = self._beagleyai_id()
-        elif chip_id == chips.DRA74X:
-            board_id = self._bbai_id()
-        elif chip_id == chips.SUN4I:
-            board_id = self._armbian_id()
-        elif chip_id == chips.SUN7I:
-            board_id = self._armbian_id()
-        elif chip_id == chips.SUN8I:
-            board_id = self._armbian_id() or self._allwinner_variants_id()
-        elif chip_id == chips.SAMA5:
-            board_id = self._sama5_id()
-        elif chip_id == chips.IMX8MX:
-            board_id = self._imx8mx_id()
-        elif chip_id == chips.IMX8MP:
-            board_id = self._imx8mp_id()
-        elif chip_id == chips.IMX6ULL:
-            board_id = self._imx6ull_id()
-        elif chip_id == chips.S905Y2:
-            board_id = boards.RADXA_ZERO
-        elif chip_id == chips.ESP8266:
-            board_id = boards.FEATHER_HUZZAH
-        elif chip_id == chips.SAMD21:
-            board_id = boards.FEATHER_M0_EXPRESS
-        elif chip_id == chips.STM32F405:
-            board_id = boards.PYBOARD
-        elif chip_id in (chips.RP2040, chips.RP2350):
-            board_id = self._raspberry_pi_pico_id()
-        elif chip_id == chips.S805:
-            board_id = boards.ODROID_C1
-        elif chip_id == chips.S905:
-            board_id = boards.ODROID_C2
-        elif chip_id == chips.S905X3:
-            board_id = self._s905x3_id()
-        elif chip_id == chips.S922X:
-            board_id = boards.ODROID_N2
-        elif chip_id == chips.A311D:
-            board_id = boards.KHADAS_VIM3
-        elif chip_id == chips.EXYNOS5422:
-            board_id = boards.ODROID_XU4
-        elif chip_id == chips.FT232H:
-            board_id = boards.FTDI_FT232H
-        elif chip_id == chips.FT2232H:
-            board_id = boards.FTDI_FT2232H
-        elif chip_id == chips.FT4232H:
-            board_id = boards.FTDI_FT4232H
-        elif chip_id == chips.SPIDRIVER:
-            board_id = boards.EXCAMERA_SPIDRIVER
-        elif chip_id == chips.APQ8016:
-            board_id = boards.DRAGONBOARD_410C
-        elif chip_id in (chips.T210, chips.T186, chips.T194, chips.T234, chips.T264):
-            board_id = self._tegra_id()
-        elif chip_id == chips.HFU540:
-            board_id = self._sifive_id()
-        elif chip_id == chips.C906:
-            board_id = self._allwinner_id()
-        elif chip_id == chips.JH71X0:
-            board_id = self._beaglebone_id()
-        elif chip_id == chips.MCP2221:
-            board_id = boards.MICROCHIP_MCP2221
-        elif chip_id == chips.BINHO:
-            board_id = boards.BINHO_NOVA
-        elif chip_id == chips.LPC4330:
-            board_id = boards.GREATFET_ONE
-        elif chip_id == chips.MIPS24KC:
-            board_id = boards.ONION_OMEGA
-        elif chip_id == chips.MIPS24KEC:
-            board_id = boards.ONION_OMEGA2
-        elif chip_id == chips.ZYNQ7000:
-            board_id = self._pynq_id()
-        elif chip_id == chips.A10:
-            board_id = self._armbian_id()
-        elif chip_id == chips.A20:
-            board_id = self._armbian_id() or self._allwinner_variants_id()
-        elif chip_id == chips.A64:
-            board_id = self._pine64_id()
-        elif chip_id == chips.H6:
-            board_id = (
-                self._pine64_id()
-                or self._armbian_id()
-                or self._orange_pi_id()
-                or self._repka_variants_id()
-            )
-        elif chip_id == chips.H5:
-            board_id = (
-                self._armbian_id()
-                or self._allwinner_variants_id()
-                or self._repka_variants_id()
-            )
-        elif chip_id == chips.T527:
-            board_id = self._armbian_id() or self._allwinner_variants_id()
-        elif chip_id == chips.H618:
-            board_id = (
-                self._armbian_id()
-                or self._allwinner_variants_id()
-                or self._orange_pi_id()
-            )
-        elif chip_id == chips.H616:
-            board_id = (
-                self._armbian_id()
-                or self._allwinner_variants_id()
-                or self._orange_pi_id()
-            )
-        elif chip_id == chips.A33:
-            board_id = self._clockwork_pi_id()
-        elif chip_id == chips.K1:
-            board_id = self._armbian_id() or self._spacemit_variants_id()
-        elif chip_id == chips.RZV2N:
-            board_id = self._armbian_id() or self._renesas_variants_id()
-        elif chip_id == chips.RZV2H:
-            board_id = self._armbian_id() or self._renesas_variants_id()
-        elif chip_id == chips.RK3308:
-            board_id = self._rock_pi_id() or self._banana_pi_id()
-        elif chip_id == chips.RK3399:
-            board_id = (
-                self._rock_pi_id()
-                or self._armbian_id()
-                or self._diet_pi_id()
-                or self._asus_tinker_board_id()
-                or self._vivid_unit_id()
-                or self._vicharak_id()
-            )
-        elif chip_id == chips.RK3399PRO:
-            board_id = self._asus_tinker_board_id()
-        elif chip_id == chips.RK3399_T:
-            board_id = self._rock_pi_id() or self._armbian_id()
-        elif chip_id == chips.ATOM_X5_Z8350:
-            board_id = self._rock_pi_id()
-        elif chip_id == chips.ATOM_J4105:
-            board_id = self._j4105_id()
-        elif chip_id == chips.RK3288:
-            board_id = self._asus_tinker_board_id()
-        elif chip_id == chips.RK3328:
-            board_id = self._rock_pi_id() or self._libre_id()
-        elif chip_id == chips.RK3566:
-            board_id = self._rk3566_id()
-        elif chip_id == chips.RK3568:
-            board_id = self._rk3568_id()
-        elif chip_id == chips.RK3588:
-            board_id = (
-                self._rock_pi_id()
-                or self._orange_pi_id()
-                or self._armbian_id()
-                or self._rk3588_id()
-                or self._ameridroid_id()
-                or self._vicharak_id()
-            )
-        elif chip_id == chips.RK3588S:
-            board_id = (
-                self._orange_pi_id() or self._armbian_id() or self._ameridroid_id()
-            )
-        elif chip_id == chips.RYZEN_V1605B:
-            board_id = self._udoo_id()
-        elif chip_id == chips.PENTIUM_N3710:
-            board_id = self._udoo_id()
-        elif chip_id == chips.CELERON_N5105:
-            board_id = self._intel_n_series_id()
-        elif chip_id == chips.STM32MP157:
-            board_id = self._stm32mp1_id()
-        elif chip_id == chips.STM32MP157DAA1:
-            board_id = self._stm32mp1_id()
-        elif chip_id == chips.MT8167:
-            board_id = boards.CORAL_EDGE_TPU_DEV_MINI
-        elif chip_id == chips.RP2040_U2IF:
-            board_id = self._rp2040_u2if_id()
-        elif chip_id == chips.GENERIC_X86:
-            board_id = boards.GENERIC_LINUX_PC
-        elif chip_id == chips.TDA4VM:
-            board_id = self._beaglebone_id() or self._tisk_id()
-        elif chip_id == chips.D1_RISCV:
-            board_id = self._armbian_id()
-        elif chip_id == chips.S905X:
-            board_id = boards.AML_S905X_CC
-        elif chip_id == chips.CV1800B:
-            board_id = boards.MILKV_DUO
-        elif chip_id == chips.TH1520:
-            board_id = boards.LICHEEPI_4A
-        elif chip_id == chips.RV1103:
-            board_id = self._rv1103_id()
-        elif chip_id == chips.RV1106:
-            board_id = self._rv1106_id()
-        elif chip_id == chips.SUNRISE_X3:
-            board_id = boards.RDK_X3
-        elif chip_id == chips.SUNRISE_X5:
-            board_id = boards.RDK_X5
-        elif chip_id == chips.QCM6490:
-            board_id = boards.PARTICLE_TACHYON
-        self._board_id = board_id
+        for resolver in self._CHIP_RESOLVERS.get(chip_id, ()):
+            if tracer is not None:
+                start = tracer.now()
+            if isinstance(resolver, str):
+                board_id = resolver
+            else:
+                board_id = resolver(self)
+            if tracer is not None:
+                name = getattr(resolver, "__name__", "constant")
+                tracer.record("resolver", name, board_id, start)
+            if board_id:
+                break
         return board_id
 
-    # pylint: enable=invalid-name
+    def invalidate(self) -> None:
+        """Forget the cached board id so the next access detects it again."""
+        self._board_id = _UNSET
+        self._rev_code = _UNSET
+        self._families = _UNSET
+        for name in self._flag_names:
+            del self.__dict__[name]
+        self._flag_names = ()
+
+    @property
+    def families(self) -> FrozenSet[str]:
+        """Return the names of the board families the board belongs to.
+
+        Each name is that of the ``any_*`` property testing for the family,
+        without ``any_``, so ``"raspberry_pi_40_pin" in board.families`` is
+        ``board.any_raspberry_pi_40_pin``.
+        """
+        if self._families is not _UNSET:
+            return self._families
+        families = self._id_families()
+        if self._pi_rev_code() is not None:
+            families = families | _RASPBERRY_PI_FAMILY
+        # A board forced through BLINKA_FORCEBOARD is not cached, so neither
+        # are its families
+        if self._board_id is not _UNSET:
+            self._families = families
+        return families
+
+    @property
+    def rev_code(self) -> Optional[str]:
+        """Return the Raspberry Pi revision code of the board, if any."""
+        return self._pi_rev_code()
+
+    def _id_families(self) -> FrozenSet[str]:
+        """Return the families of the board id, leaving out "raspberry_pi".
+
+        Unlike the revision code, this reads nothing for a forced board.
+        """
+        return _FAMILIES_BY_ID.get(self.id, _NO_FAMILIES)
+
     def _starfive_id(self) -> Optional[str]:
         model = None
         model_value = self.detector.get_device_model()
@@ -280,17 +325,17 @@ class Board:
     @property
     def any_starfive_id(self):
         """Check whether the current board is any Pine64 device."""
-        return self.id in boards._STARFIVE_BOARD_IDS
+        return "starfive_id" in self._id_families()
 
     def _pi_id(self) -> Optional[str]:
         """Try to detect id of a Raspberry Pi."""
         # Check for Pi boards:
         pi_rev_code = self._pi_rev_code()
         if pi_rev_code:
-            from adafruit_platformdetect.revcodes import PiDecoder
+            from adafruit_platformdetect.revcodes import get_decoder
 
             try:
-                decoder = PiDecoder(pi_rev_code)
+                decoder = get_decoder(pi_rev_code)
                 model = boards._PI_MODELS[decoder.type_raw]
                 if isinstance(model, dict):
                     model = model[decoder.revision]
@@ -302,6 +347,8 @@ class Board:
         else:
             pi_model = self.detector.get_device_model()
             if pi_model:
+                import re
+
                 pi_model = pi_model.upper().replace(" ", "_")
                 if "PLUS" in pi_model:
                     re_model = re.search(r"(RASPBERRY_PI_\d).*([AB]_*)(PLUS)", pi_model)
@@ -324,6 +371,13 @@ class Board:
 
     def _pi_rev_code(self) -> Optional[str]:
         """Attempt to find a Raspberry Pi revision code for this board."""
+        if self._rev_code is _UNSET:
+            self._rev_code = self.detector.cached_result(
+                "rev_code", self._read_pi_rev_code
+            )
+        return self._rev_code
+
+    def _read_pi_rev_code(self) -> Optional[str]:
         # 2708 is Pi 1
         # 2709 is Pi 2
         # 2835 is Pi 3 (or greater) on 4.9.x kernel
@@ -337,43 +391,45 @@ class Board:
             return rev
 
         try:
-            with open("/proc/device-tree/system/linux,revision", "rb") as revision:
-                rev_bytes = revision.read()
-
-                if rev_bytes[:1] == b"\x00":
-                    rev_bytes = rev_bytes[1:]
-
-                return rev_bytes.hex()
+            rev_bytes = self.detector.sysroot.read_bytes(
+                "/proc/device-tree/system/linux,revision"
+            )
         except FileNotFoundError:
             return None
 
+        if rev_bytes[:1] == b"\x00":
+            rev_bytes = rev_bytes[1:]
+
+        return rev_bytes.hex()
+
     # pylint: disable=no-self-use
     def _beaglebone_id(self) -> Optional[str]:
         """Try to detect id of a Beaglebone."""
-        board_value = self.detector.get_device_compatible()
+        compatible = self.detector.get_dt_compatible()
         # Older Builds
-        if "freedom-u74-arty" in board_value:
+        if "freedom-u74-arty" in compatible:
             return boards.BEAGLEV_STARLIGHT
 
         # Newer Builds
-        if "beaglev-starlight" in board_value:
+        if "beaglev-starlight" in compatible:
             return boards.BEAGLEV_STARLIGHT
 
         # find device alias at i2c address 0x50 (0-00500, 0-00501, etc)
-        nvmem_devices = glob.glob("/sys/bus/nvmem/devices/0-0050*")
+        sysroot = self.detector.sysroot
+        nvmem_devices = sysroot.glob("/sys/bus/nvmem/devices/0-0050*")
         # do not expect there to be anything but one eeprom
         if len(nvmem_devices) != 1:
             return None
 
         eeprom_dir = nvmem_devices[0]
         try:
-            with open(f"{eeprom_dir}/nvmem", "rb") as eeprom:
-                eeprom_bytes = eeprom.read(16)
+            eeprom_bytes = sysroot.read_bytes(f"{eeprom_dir}/nvmem", 16)
         except FileNotFoundError:
             try:
                 # Special Case for AI64
-                with open("/sys/bus/nvmem/devices/2-00500/nvmem", "rb") as eeprom:
-                    eeprom_bytes = eeprom.read(16)
+                eeprom_bytes = sysroot.read_bytes(
+                    "/sys/bus/nvmem/devices/2-00500/nvmem", 16
+                )
             except FileNotFoundError:
                 return None
 
@@ -392,8 +448,7 @@ class Board:
         # BeaglePlay Special Condition
         # new Beagle EEPROM IDs are 24 Bit, so we need to verify full range
         if eeprom_bytes == b"\xaaU3\xee\x017\x00\x10.\x00BEAGLE":
-            with open(f"{eeprom_dir}/nvmem", "rb") as eeprom:
-                eeprom_bytes = eeprom.read(24)
+            eeprom_bytes = sysroot.read_bytes(f"{eeprom_dir}/nvmem", 24)
             if eeprom_bytes == b"\xaaU3\xee\x017\x00\x10.\x00BEAGLEPLAY-A0-":
                 return boards.BEAGLE_PLAY
 
@@ -403,7 +458,6 @@ class Board:
                 if id_string == bb_id[1]:
                     return model
 
-        board_value = self.detector.get_armbian_release_field("BOARD")
         return None
 
     # pylint: enable=no-self-use
@@ -423,13 +477,11 @@ class Board:
 
     def _tisk_id(self) -> Optional[str]:
         """Try to detect the id of aarch64 board."""
-        compatible = self.detector.get_device_compatible()
-        print(compatible)
+        compatible = self.detector.get_dt_compatible()
         if not compatible:
             return None
-        compats = compatible.split("\x00")
         for board_id, board_compats in boards._TI_SK_BOARD_IDS:
-            if any(v in compats for v in board_compats):
+            if any(compatible.has_entry(v) for v in board_compats):
                 return board_id
         return None
 
@@ -531,8 +583,8 @@ class Board:
             board = boards.MILKV_DUO
         return board
 
-    @staticmethod
-    def _raspberry_pi_pico_id() -> Optional[str]:
+    # pylint: disable=no-self-use
+    def _raspberry_pi_pico_id(self) -> Optional[str]:
         """Try to detect id of a Raspberry Pi Pico."""
         board_id = os.uname().machine
         if "Raspberry Pi Pico 2 W" in board_id:
@@ -545,6 +597,8 @@ class Board:
             return boards.RASPBERRY_PI_PICO
         return None
 
+    # pylint: enable=no-self-use
+
     # pylint: enable=too-many-return-statements
 
     def _diet_pi_id(self) -> Optional[str]:
@@ -651,12 +705,11 @@ class Board:
 
     def _tegra_id(self) -> Optional[str]:
         """Try to detect the id of aarch64 board."""
-        compatible = self.detector.get_device_compatible()
+        compatible = self.detector.get_dt_compatible()
         if not compatible:
             return None
-        compats = compatible.split("\x00")
         for board_id, board_compats in boards._JETSON_IDS:
-            if any(v in compats for v in board_compats):
+            if any(compatible.has_entry(v) for v in board_compats):
                 return board_id
         return None
 
@@ -694,20 +747,19 @@ class Board:
     def _pynq_id(self) -> Optional[str]:
         """Try to detect the id for Xilinx PYNQ boards."""
         try:
-            with open(
-                "/proc/device-tree/chosen/pynq_board", "r", encoding="utf-8"
-            ) as board_file:
-                board_model = board_file.read()
-                match = board_model.upper().replace("-", "_").rstrip("\x00")
-                for model in boards._PYNQ_IDS:
-                    if model == match:
-                        return model
-
-                return None
-
+            board_model = self.detector.sysroot.read_text(
+                "/proc/device-tree/chosen/pynq_board"
+            )
         except FileNotFoundError:
             return None
 
+        match = board_model.upper().replace("-", "_").rstrip("\x00")
+        for model in boards._PYNQ_IDS:
+            if model == match:
+                return model
+
+        return None
+
     def _rk3566_id(self) -> Optional[str]:
         """Check what type of rk3566 board."""
         board_value = self.detector.get_device_model()
@@ -826,15 +878,14 @@ class Board:
     def _j4105_id(self) -> Optional[str]:
         """Try to detect the id of J4105 board."""
         try:
-            with open(
-                "/sys/devices/virtual/dmi/id/board_name", "r", encoding="utf-8"
-            ) as board_name:
-                board_value = board_name.read().rstrip()
-            if board_value in ("ODYSSEY-X86J41X5", "ODYSSEY-X86J41O5"):
-                return boards.ODYSSEY_X86J41X5
-            return None
+            board_value = self.detector.sysroot.read_text(
+                "/sys/devices/virtual/dmi/id/board_name"
+            ).rstrip()
         except FileNotFoundError:
             return None
+        if board_value in ("ODYSSEY-X86J41X5", "ODYSSEY-X86J41O5"):
+            return boards.ODYSSEY_X86J41X5
+        return None
 
     def _asus_tinker_board_id(self) -> Optional[str]:
         """Check what type of Tinker Board."""
@@ -957,54 +1008,15 @@ class Board:
 
         return board
 
-    # pylint: disable=too-many-return-statements
-
     def _rp2040_u2if_id(self) -> Optional[str]:
-        import hid
-
-        # look for it based on PID/VID
-        for dev in hid.enumerate():
-            # Raspberry Pi Pico
-            vendor = dev["vendor_id"]
-            product = dev["product_id"]
-            if vendor == 0xCAFE and product == 0x4005:
-                return boards.PICO_U2IF
-            if vendor == 0xCAFF and product == 0x4005:
-                return boards.RADXA_X4_U2IF
-            if vendor == 0x239A:
-                # Feather RP2040
-                if product == 0x00F1:
-                    return boards.FEATHER_U2IF
-                # Itsy Bitsy RP2040
-                if product == 0x00FD:
-                    return boards.ITSYBITSY_U2IF
-                # QT Py RP2040
-                if product == 0x00F7:
-                    return boards.QTPY_U2IF
-                # QT2040 Trinkey
-                if product == 0x0109:
-                    return boards.QT2040_TRINKEY_U2IF
-                # MacroPad RP2040
-                if product == 0x0107:
-                    return boards.MACROPAD_U2IF
-                # Feather RP2040 ThinkInk
-                if product == 0x812C:
-                    return boards.FEATHER_EPD_U2IF
-                # Feather RP2040 RFM
-                if product == 0x812E:
-                    return boards.FEATHER_RFM_U2IF
-                # Feather RP2040 CAN
-                if product == 0x8130:
-                    return boards.FEATHER_CAN_U2IF
-                # KB2040 Kee Board
-                if product == 0x0105:
-                    return boards.KB2040_U2IF
-            if vendor == 0x2E8A and product == 0x103A:
-                return boards.RP2040_ONE_U2IF
-        # Will only reach here if a device was added in chip.py but here.
-        raise RuntimeError("RP2040_U2IF device was added to chip but not board.")
+        from adafruit_platformdetect.usbdevices import USB_IDS
 
-    # pylint: enable=too-many-return-statements
+        # The first u2if device found by the chip detection
+        found = self.detector.get_usb_devices().find_hid(chips.RP2040_U2IF)
+        if found:
+            return USB_IDS[found[0]][1]
+        # Will only reach here if the devices changed since the chip was found
+        raise RuntimeError("RP2040_U2IF device was added to chip but not board.")
 
     def _siemens_simatic_iot2000_id(self) -> Optional[str]:
         """Try to detect if this is a IOT2050 Gateway."""
@@ -1038,313 +1050,362 @@ class Board:
             board = boards.LUCKFOX_PICO_ULTRA
         return board
 
+    # Board resolvers for each chip id, tried in order until one of them
+    # returns a board id. Plain strings are board ids used as they are.
+    _CHIP_RESOLVERS = {
+        chips.H3: (_armbian_id, _allwinner_variants_id),
+        chips.JH7110: (_starfive_id,),
+        chips.BCM2XXX: (_pi_id,),
+        chips.OS_AGNOSTIC: (boards.OS_AGNOSTIC_BOARD,),
+        chips.AM625X: (_beaglebone_id,),
+        chips.AM33XX: (_beaglebone_id,),
+        chips.AM65XX: (_siemens_simatic_iot2000_id,),
+        chips.AM67A: (_beagleyai_id,),
+        chips.DRA74X: (_bbai_id,),
+        chips.SUN4I: (_armbian_id,),
+        chips.SUN7I: (_armbian_id,),
+        chips.SUN8I: (_armbian_id, _allwinner_variants_id),
+        chips.SAMA5: (_sama5_id,),
+        chips.IMX8MX: (_imx8mx_id,),
+        chips.IMX8MP: (_imx8mp_id,),
+        chips.IMX6ULL: (_imx6ull_id,),
+        chips.S905Y2: (boards.RADXA_ZERO,),
+        chips.ESP8266: (boards.FEATHER_HUZZAH,),
+        chips.SAMD21: (boards.FEATHER_M0_EXPRESS,),
+        chips.STM32F405: (boards.PYBOARD,),
+        chips.RP2040: (_raspberry_pi_pico_id,),
+        chips.RP2350: (_raspberry_pi_pico_id,),
+        chips.S805: (boards.ODROID_C1,),
+        chips.S905: (boards.ODROID_C2,),
+        chips.S905X3: (_s905x3_id,),
+        chips.S922X: (boards.ODROID_N2,),
+        chips.A311D: (boards.KHADAS_VIM3,),
+        chips.EXYNOS5422: (boards.ODROID_XU4,),
+        chips.FT232H: (boards.FTDI_FT232H,),
+        chips.FT2232H: (boards.FTDI_FT2232H,),
+        chips.FT4232H: (boards.FTDI_FT4232H,),
+        chips.SPIDRIVER: (boards.EXCAMERA_SPIDRIVER,),
+        chips.APQ8016: (boards.DRAGONBOARD_410C,),
+        chips.T210: (_tegra_id,),
+        chips.T186: (_tegra_id,),
+        chips.T194: (_tegra_id,),
+        chips.T234: (_tegra_id,),
+        chips.T264: (_tegra_id,),
+        chips.HFU540: (_sifive_id,),
+        chips.C906: (_allwinner_id,),
+        chips.JH71X0: (_beaglebone_id,),
+        chips.MCP2221: (boards.MICROCHIP_MCP2221,),
+        chips.BINHO: (boards.BINHO_NOVA,),
+        chips.LPC4330: (boards.GREATFET_ONE,),
+        chips.MIPS24KC: (boards.ONION_OMEGA,),
+        chips.MIPS24KEC: (boards.ONION_OMEGA2,),
+        chips.ZYNQ7000: (_pynq_id,),
+        chips.A10: (_armbian_id,),
+        chips.A20: (_armbian_id, _allwinner_variants_id),
+        chips.A64: (_pine64_id,),
+        chips.H6: (_pine64_id, _armbian_id, _orange_pi_id, _repka_variants_id),
+        chips.H5: (_armbian_id, _allwinner_variants_id, _repka_variants_id),
+        chips.T527: (_armbian_id, _allwinner_variants_id),
+        chips.H618: (_armbian_id, _allwinner_variants_id, _orange_pi_id),
+        chips.H616: (_armbian_id, _allwinner_variants_id, _orange_pi_id),
+        chips.A33: (_clockwork_pi_id,),
+        chips.K1: (_armbian_id, _spacemit_variants_id),
+        chips.RZV2N: (_armbian_id, _renesas_variants_id),
+        chips.RZV2H: (_armbian_id, _renesas_variants_id),
+        chips.RK3308: (_rock_pi_id, _banana_pi_id),
+        chips.RK3399: (
+            _rock_pi_id,
+            _armbian_id,
+            _diet_pi_id,
+            _asus_tinker_board_id,
+            _vivid_unit_id,
+            _vicharak_id,
+        ),
+        chips.RK3399PRO: (_asus_tinker_board_id,),
+        chips.RK3399_T: (_rock_pi_id, _armbian_id),
+        chips.ATOM_X5_Z8350: (_rock_pi_id,),
+        chips.ATOM_J4105: (_j4105_id,),
+        chips.RK3288: (_asus_tinker_board_id,),
+        chips.RK3328: (_rock_pi_id, _libre_id),
+        chips.RK3566: (_rk3566_id,),
+        chips.RK3568: (_rk3568_id,),
+        chips.RK3588: (
+            _rock_pi_id,
+            _orange_pi_id,
+            _armbian_id,
+            _rk3588_id,
+            _ameridroid_id,
+            _vicharak_id,
+        ),
+        chips.RK3588S: (_orange_pi_id, _armbian_id, _ameridroid_id),
+        chips.RYZEN_V1605B: (_udoo_id,),
+        chips.PENTIUM_N3710: (_udoo_id,),
+        chips.CELERON_N5105: (_intel_n_series_id,),
+        chips.STM32MP157: (_stm32mp1_id,),
+        chips.STM32MP157DAA1: (_stm32mp1_id,),
+        chips.MT8167: (boards.CORAL_EDGE_TPU_DEV_MINI,),
+        chips.RP2040_U2IF: (_rp2040_u2if_id,),
+        chips.GENERIC_X86: (boards.GENERIC_LINUX_PC,),
+        chips.TDA4VM: (_beaglebone_id, _tisk_id),
+        chips.D1_RISCV: (_armbian_id,),
+        chips.S905X: (boards.AML_S905X_CC,),
+        chips.CV1800B: (boards.MILKV_DUO,),
+        chips.TH1520: (boards.LICHEEPI_4A,),
+        chips.RV1103: (_rv1103_id,),
+        chips.RV1106: (_rv1106_id,),
+        chips.SUNRISE_X3: (boards.RDK_X3,),
+        chips.SUNRISE_X5: (boards.RDK_X5,),
+        chips.QCM6490: (boards.PARTICLE_TACHYON,),
+    }
+
+    @classmethod
+    def resolvers_for(cls, chip_id: Optional[str]) -> tuple:
+        """
+        Return the ordered resolvers ``Board.id`` tries for ``chip_id``: board
+        resolver functions, or board ids for chips that map to a single board.
+        """
+        return cls._CHIP_RESOLVERS.get(chip_id, ())
+
     @property
     def any_siemens_simatic_iot2000(self) -> bool:
         """Check whether the current board is a SIEMENS SIMATIC IOT2000 Gateway."""
-        return self.id in boards._SIEMENS_SIMATIC_IOT2000_IDS
+        return "siemens_simatic_iot2000" in self._id_families()
 
     @property
     def any_walnutpi(self) -> bool:
         """Check whether the current board is any defined Walnut Pi."""
-        return self.id in boards._WALNUT_PI_IDS
+        return "walnutpi" in self._id_families()
 
     @property
     def any_nanopi(self) -> bool:
         """Check whether the current board is any defined Nano Pi."""
-        return self.id in boards._NANOPI_IDS
+        return "nanopi" in self._id_families()
 
     @property
     def any_96boards(self) -> bool:
         """Check whether the current board is any 96boards board."""
-        return self.id in boards._LINARO_96BOARDS_IDS
+        return "96boards" in self._id_families()
 
     @property
     def any_raspberry_pi(self) -> bool:
         """Check whether the current board is any Raspberry Pi."""
+        # Decided by the revision code alone, even when the board is unknown
         return self._pi_rev_code() is not None
 
     @property
     def any_raspberry_pi_40_pin(self) -> bool:
         """Check whether the current board is any 40-pin Raspberry Pi."""
-        return self.id in boards._RASPBERRY_PI_40_PIN_IDS
+        return "raspberry_pi_40_pin" in self._id_families()
 
     @property
     def any_raspberry_pi_cm(self) -> bool:
         """Check whether the current board is any Compute Module Raspberry Pi."""
-        return self.id in boards._RASPBERRY_PI_CM_IDS
+        return "raspberry_pi_cm" in self._id_families()
 
     @property
     def any_raspberry_pi_4_board(self) -> bool:
         """Check whether the current board is any Raspberry Pi 4."""
-        return self.id in boards._RASPBERRY_PI_4_IDS
+        return "raspberry_pi_4_board" in self._id_families()
 
     @property
     def any_raspberry_pi_5_board(self) -> bool:
         """Check whether the current board is any Raspberry Pi 5."""
-        return self.id in boards._RASPBERRY_PI_5_IDS
+        return "raspberry_pi_5_board" in self._id_families()
 
     @property
     def any_beaglebone(self) -> bool:
         """Check whether the current board is any Beaglebone-family system."""
-        return self.id in boards._BEAGLEBONE_IDS
+        return "beaglebone" in self._id_families()
 
     @property
     def any_ameridroid(self) -> bool:
         """Check whether the current board is any Ameridroid device."""
-        return self.id in boards._AMERIDROID_IDS
+        return "ameridroid" in self._id_families()
 
     @property
     def any_orange_pi(self) -> bool:
         """Check whether the current board is any defined Orange Pi."""
-        return self.id in boards._ORANGE_PI_IDS
+        return "orange_pi" in self._id_families()
 
     @property
     def any_lubancat(self) -> bool:
         """Check whether the current board is any defined lubancat."""
-        return self.id in boards._LUBANCAT_IDS
+        return "lubancat" in self._id_families()
 
     @property
     def any_coral_board(self) -> bool:
         """Check whether the current board is any defined Coral."""
-        return self.id in boards._CORAL_IDS
+        return "coral_board" in self._id_families()
 
     @property
     def any_pynq_board(self) -> bool:
         """Check whether the current board is any defined PYNQ Board."""
-        return self.id in boards._PYNQ_IDS
+        return "pynq_board" in self._id_families()
 
     @property
     def any_giant_board(self) -> bool:
         """Check whether the current board is any defined Giant Board."""
-        return self.GIANT_BOARD
+        return "giant_board" in self._id_families()
 
     @property
     def any_odroid_40_pin(self) -> bool:
         """Check whether the current board is any defined 40-pin Odroid."""
-        return self.id in boards._ODROID_40_PIN_IDS
+        return "odroid_40_pin" in self._id_families()
 
     @property
     def any_odroid_mini_pc(self) -> bool:
         """Check whether the current board is any defined Odroid Mini PC."""
-        return self.id in boards._ODROID_MINI_PC_IDS
+        return "odroid_mini_pc" in self._id_families()
 
     @property
     def khadas_vim3_40_pin(self) -> bool:
         """Check whether the current board is any defined 40-pin Khadas VIM3."""
-        return self.id in boards._KHADAS_40_PIN_IDS
+        return "khadas_vim3_40_pin" in self._id_families()
 
     @property
     def any_jetson_board(self) -> bool:
         """Check whether the current board is any defined Jetson Board."""
-        return self.id in [v[0] for v in boards._JETSON_IDS]
+        return "jetson_board" in self._id_families()
 
     @property
     def any_sifive_board(self) -> bool:
         """Check whether the current board is any defined Jetson Board."""
-        return self.id in boards._SIFIVE_IDS
+        return "sifive_board" in self._id_families()
 
     @property
     def any_onion_omega_board(self) -> bool:
         """Check whether the current board is any defined OpenWRT board."""
-        return self.id in boards._ONION_OMEGA_BOARD_IDS
+        return "onion_omega_board" in self._id_families()
 
     @property
     def any_pine64_board(self) -> bool:
         """Check whether the current board is any Pine64 device."""
-        return self.id in boards._PINE64_DEV_IDS
+        return "pine64_board" in self._id_families()
 
     @property
     def any_milkv_board(self) -> bool:
         """Check whether the current board is any MilkV device."""
-        return self.id in boards._MILKV_IDS_
+        return "milkv_board" in self._id_families()
 
     @property
     def any_rock_pi_board(self) -> bool:
         """Check whether the current board is any Rock Pi device."""
-        return self.id in boards._ROCK_PI_IDS
+        return "rock_pi_board" in self._id_families()
 
     @property
     def any_vicharak_board(self) -> bool:
         """Check whether the current board is any vicharak device."""
-        return self.id in boards._VICHARAK_BOARD_IDS
+        return "vicharak_board" in self._id_families()
 
     @property
     def any_clockwork_pi_board(self) -> bool:
         """Check whether the current board is any Clockwork Pi device."""
-        return self.CLOCKWORK_CPI3
+        return "clockwork_pi_board" in self._id_families()
 
     @property
     def any_udoo_board(self) -> bool:
         """Check to see if the current board is an UDOO board"""
-        return self.id in boards._UDOO_BOARD_IDS
+        return "udoo_board" in self._id_families()
 
     @property
     def any_seeed_board(self) -> bool:
         """Check to see if the current board is an SEEED board"""
-        return self.id in boards._SEEED_BOARD_IDS
+        return "seeed_board" in self._id_families()
 
     @property
     def any_asus_tinker_board(self) -> bool:
         """Check to see if the current board is an ASUS Tinker Board"""
-        return self.id in boards._ASUS_TINKER_BOARD_IDS
+        return "asus_tinker_board" in self._id_families()
 
     @property
     def any_pcduino_board(self) -> bool:
         """Check whether the current board is any Pcduino board"""
-        return self.id in boards._PCDUINO_DEV_IDS
+        return "pcduino_board" in self._id_families()
 
     @property
     def any_stm32mp1(self) -> bool:
         """Check whether the current board is any stm32mp1 board."""
-        return self.id in boards._STM32MP1_IDS
+        return "stm32mp1" in self._id_families()
 
     @property
     def any_bananapi(self) -> bool:
         """Check whether the current board is any BananaPi-family system."""
-        return self.id in boards._BANANA_PI_IDS
+        return "bananapi" in self._id_families()
 
     @property
     def any_lemaker(self) -> bool:
         """Check whether the current board is any LeMaker board."""
-        return self.id in boards._LEMAKER_IDS
+        return "lemaker" in self._id_families()
 
     @property
     def any_maaxboard(self) -> bool:
         """Check whether the current board is any BananaPi-family system."""
-        return self.id in boards._MAAXBOARD_IDS
+        return "maaxboard" in self._id_families()
 
     @property
     def any_tisk_board(self) -> bool:
         """Check whether the current board is any defined TI SK Board."""
-        return self.id in [v[0] for v in boards._TI_SK_BOARD_IDS]
+        return "tisk_board" in self._id_families()
 
     @property
     def any_lichee_riscv_board(self) -> bool:
         """Check whether the current board is any defined Lichee RISC-V."""
-        return self.id in boards._LICHEE_RISCV_IDS
+        return "lichee_riscv_board" in self._id_families()
 
     @property
     def any_libre_computer_board(self) -> bool:
         """Check whether the current board is any defined Libre Computer board."""
-        return self.id in boards._LIBRE_COMPUTER_IDS
+        return "libre_computer_board" in self._id_families()
 
     @property
     def any_nxp_navq_board(self) -> bool:
         """Check whether the current board is any NXP NavQ board"""
-        return self.id in boards._NXP_SOM_IDS
+        return "nxp_navq_board" in self._id_families()
 
     @property
     def any_olimex_board(self):
         """Check whether the current board is any Olimex device."""
-        return self.id in boards._OLIMEX_IDS
+        return "olimex_board" in self._id_families()
 
     @property
     def any_repka_board(self):
         """Check whether the current board is any Repka device."""
-        return self.id in boards._REPKA_PI_IDS
+        return "repka_board" in self._id_families()
 
     @property
     def any_luckfox_pico_board(self):
         """Check whether the current board is any Luckfox Pico device."""
-        return self.id in boards._LUCKFOX_IDS
+        return "luckfox_pico_board" in self._id_families()
 
     @property
     def any_vivid_unit(self):
         """Check whether the current board is any Vivid Unit device."""
-        return self.id in boards._VIVID_UNIT_IDS
+        return "vivid_unit" in self._id_families()
 
     @property
     def any_horizon_board(self):
         """Check whether the current board is any Horizon device."""
-        return self.id in boards._HORIZON_IDS
+        return "horizon_board" in self._id_families()
 
     @property
     def any_particle_board(self):
         """Check whether the current board is any Particle device."""
-        return self.id in boards._PARTICLE_IDS
+        return "particle_board" in self._id_families()
 
     @property
     def any_raspberry_pi_pico_id(self):
         """Check whether the current board is any Raspberry Pi Pico."""
-        return self.id in boards._RASPBERRY_PI_PICO_IDS
+        return "raspberry_pi_pico_id" in self._id_families()
 
     @property
     def os_environ_board(self) -> bool:
         """Check whether the current board is an OS environment variable special case."""
-
-        def lazily_generate_conditions():
-            yield self.board.FTDI_FT232H
-            yield self.board.FTDI_FT2232H
-            yield self.board.FTDI_FT4232H
-            yield self.board.MICROCHIP_MCP2221
-            yield self.board.BINHO_NOVA
-            yield self.board.GREATFET_ONE
-            yield self.board.PICO_U2IF
-            yield self.board.FEATHER_U2IF
-            yield self.board.FEATHER_CAN_U2IF
-            yield self.board.FEATHER_EPD_U2IF
-            yield self.board.FEATHER_RFM_U2IF
-            yield self.board.ITSYBITY_U2IF
-            yield self.board.MACROPAD_U2IF
-            yield self.board.QTPY_U2IF
-            yield self.board.QT2040_TRINKEY_U2IF
-            yield self.board.KB2040_U2IF
-            yield self.board.RP2040_ONE_U2IF
-            yield self.board.RADXA_X4_U2IF
-            yield self.board.OS_AGNOSTIC_BOARD
-
-        return any(condition for condition in lazily_generate_conditions())
+        return self.id in _OS_ENVIRON_BOARD_IDS
 
     @property
     def any_embedded_linux(self) -> bool:
         """Check whether the current board is any embedded Linux device."""
-
-        def lazily_generate_conditions():
-            yield self.any_raspberry_pi_40_pin
-            yield self.any_raspberry_pi
-            yield self.any_beaglebone
-            yield self.any_ameridroid
-            yield self.any_orange_pi
-            yield self.any_nanopi
-            yield self.any_giant_board
-            yield self.any_jetson_board
-            yield self.any_coral_board
-            yield self.any_odroid_40_pin
-            yield self.any_odroid_mini_pc
-            yield self.khadas_vim3_40_pin
-            yield self.any_96boards
-            yield self.any_sifive_board
-            yield self.any_onion_omega_board
-            yield self.any_pine64_board
-            yield self.any_pynq_board
-            yield self.any_rock_pi_board
-            yield self.any_clockwork_pi_board
-            yield self.any_udoo_board
-            yield self.any_seeed_board
-            yield self.any_asus_tinker_board
-            yield self.any_stm32mp1
-            yield self.any_lubancat
-            yield self.any_bananapi
-            yield self.any_lemaker
-            yield self.any_maaxboard
-            yield self.any_tisk_board
-            yield self.any_siemens_simatic_iot2000
-            yield self.any_lichee_riscv_board
-            yield self.any_pcduino_board
-            yield self.any_libre_computer_board
-            yield self.generic_linux
-            yield self.any_nxp_navq_board
-            yield self.any_walnutpi
-            yield self.any_olimex_board
-            yield self.any_repka_board
-            yield self.any_milkv_board
-            yield self.any_luckfox_pico_board
-            yield self.any_vivid_unit
-            yield self.any_starfive_id
-            yield self.any_horizon_board
-            yield self.any_particle_board
-
-        return any(condition for condition in lazily_generate_conditions())
+        return self.id in _EMBEDDED_LINUX_IDS or self.any_raspberry_pi
 
     @property
     def generic_linux(self) -> bool:
@@ -1455,7 +1516,26 @@ class Board:
         """
         Detect whether the given attribute is the currently-detected board.  See list
         of constants at the top of this module for available options.
+
+        Once the board is detected, every board constant is stored as a plain
+        attribute, so later checks do not come back here. With the detector
+        in strict mode, a name that is not a board constant raises
+        :class:`AttributeError` instead of returning ``False``.
         """
-        if self.id == attr:
-            return True
-        return False
+        board_id = self.id
+        if attr == board_id:
+            result = True
+        elif attr in _BOARD_NAMES:
+            result = False
+        elif self.detector.strict:
+            raise AttributeError("{!r} is not a known board".format(attr))
+        else:
+            return False
+        # A board forced through BLINKA_FORCEBOARD is not cached
+        if self._board_id is not _UNSET and not self._flag_names:
+            flags = dict.fromkeys(_BOARD_NAMES, False)
+            if isinstance(board_id, str):
+                flags[board_id] = True
+            self.__dict__.update(flags)
+            self._flag_names = tuple(flags)
+        return result
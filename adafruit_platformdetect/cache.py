@@ -0,0 +1,177 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_platformdetect.cache`
+================================================================================
+
+Persistent detection cache shared by processes on the same boot
+
+Detection reads the device tree, /proc/cpuinfo, EEPROMs and DMI tables. For
+hosts that start many short lived Python processes, the resolved chip id,
+board id and Raspberry Pi revision code can be stored in a small JSON file,
+for example under ``/run``. Set ``BLINKA_DETECTION_CACHE`` to the file path,
+or pass ``cache_path`` to :class:`adafruit_platformdetect.Detector`.
+
+Entries are only used while the boot id, the size and modification time of
+the probed files, the ``BLINKA_*`` environment and the library version all
+match the values recorded with them. A missing, unreadable, corrupt or stale
+file is ignored and detection runs live as usual.
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Linux and Python 3.7 or Higher
+
+"""
+
+import json
+import os
+import sys
+
+try:
+    from typing import Any, Dict, Optional
+except ImportError:
+    pass
+
+from adafruit_platformdetect.chip import __version__
+
+CACHE_ENV = "BLINKA_DETECTION_CACHE"
+
+BOOT_ID_PATH = "/proc/sys/kernel/random/boot_id"
+
+# Files whose contents decide the result. /proc/cpuinfo is left out since
+# procfs reports no useful size or mtime for it and it cannot change without
+# a reboot, which the boot id already covers.
+SOURCE_PATHS = (
+    "/proc/device-tree/compatible",
+    "/proc/device-tree/model",
+    "/proc/device-tree/system/linux,revision",
+    "/proc/device-tree/chosen/pynq_board",
+    "/etc/armbian-release",
+    "/sys/devices/virtual/dmi/id/board_name",
+    "/sys/devices/virtual/dmi/id/board_asset_tag",
+)
+
+# Environment variables that make detection depend on which USB adapters are
+# plugged in right now. The cache is bypassed while any of them is set.
+USB_BRIDGE_ENV = (
+    "BLINKA_FT232H",
+    "BLINKA_FT2232H",
+    "BLINKA_FT4232H",
+    "BLINKA_MCP2221",
+    "BLINKA_U2IF",
+    "BLINKA_GREATFET",
+)
+
+_FORMAT_VERSION = 1
+
+
+class DetectionCache:
+    """Detection results stored in a JSON file, valid for the current boot."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._key = None  # type: Optional[Dict[str, Any]]
+        self._values = None  # type: Optional[Dict[str, Any]]
+
+    @property
+    def enabled(self) -> bool:
+        """Whether results can be cached for this process at all."""
+        return self._get_key() is not None
+
+    def _get_key(self) -> Optional[Dict[str, Any]]:
+        if self._key is None:
+            if any(os.environ.get(name) for name in USB_BRIDGE_ENV):
+                return None
+            try:
+                with open(BOOT_ID_PATH, "r", encoding="utf-8") as boot_id_file:
+                    boot_id = boot_id_file.read().strip()
+            except OSError:
+                return None
+            sources = {}
+            for path in SOURCE_PATHS:
+                try:
+                    stat = os.stat(path)
+                    sources[path] = [stat.st_size, stat.st_mtime_ns]
+                except OSError:
+                    sources[path] = None
+            self._key = {
+                "boot_id": boot_id,
+                "version": __version__,
+                "platform": sys.platform,
+                "environ": {
+                    name: value
+                    for name, value in sorted(os.environ.items())
+                    if name.startswith("BLINKA_") and name != CACHE_ENV
+                },
+                "sources": sources,
+            }
+        return self._key
+
+    def _load(self) -> Dict[str, Any]:
+        if self._values is None:
+            self._values = {}
+            key = self._get_key()
+            if key is None:
+                return self._values
+            try:
+                with open(self.path, "r", encoding="utf-8") as cache_file:
+                    data = json.load(cache_file)
+                if (
+                    data.get("format") == _FORMAT_VERSION
+                    and data.get("key") == key
+                    and isinstance(data.get("values"), dict)
+                ):
+                    self._values = data["values"]
+            except (OSError, ValueError, AttributeError):
+                # Missing or corrupt, detection runs live and rewrites it
+                pass
+        return self._values
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._load()
+
+    def __getitem__(self, name: str) -> Any:
+        return self._load()[name]
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        values = self._load()
+        if self._get_key() is None or (name in values and values[name] == value):
+            return
+        values[name] = value
+        self._write(values)
+
+    def invalidate(self) -> None:
+        """Drop the stored results, so the next detection runs live."""
+        self._key = None
+        self._values = {}
+        if self._get_key() is not None:
+            self._write(self._values)
+
+    def _write(self, values: Dict[str, Any]) -> None:
+        # Only needed on a cache miss, and slow to import
+        import tempfile
+
+        data = {"format": _FORMAT_VERSION, "key": self._get_key(), "values": values}
+        directory = os.path.dirname(self.path) or "."
+        try:
+            # Write a private file and rename it over the old one, so
+            # concurrent readers only ever see a complete cache file.
+            handle, temp_path = tempfile.mkstemp(
+                dir=directory, prefix=".platformdetect-", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(handle, "w", encoding="utf-8") as temp_file:
+                    json.dump(data, temp_file, separators=(",", ":"))
+                os.chmod(temp_path, 0o644)
+                os.replace(temp_path, self.path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError:
+            # A read-only or missing directory just means no caching
+            pass
@@ -20,25 +20,104 @@ Implementation Notes
 """
 
 import os
-import sys
 
 try:
-    from typing import Optional
+    from typing import Iterable, Mapping, Optional, Tuple
 except ImportError:
     pass
 
 from adafruit_platformdetect.constants import chips
+from adafruit_platformdetect.devicetree import CompatibleMatcher
 
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_PlatformDetect.git"
 
+# Device tree compatible substrings and the chip each one identifies. The
+# order is the priority: when several are found in
+# /proc/device-tree/compatible the one listed first wins, so more specific
+# values ("rockchip,rk3588s") must come before their prefixes
+# ("rockchip,rk3588").
+_DT_COMPATIBLE_CHIPS = (
+    ("beagle,am67a-beagley-ai", chips.AM67A),
+    ("beagle,am62-pocketbeagle2ti,am625", chips.AM625X),
+    ("ti,am625", chips.AM625X),
+    ("ti,am654", chips.AM65XX),
+    ("ti,am652", chips.AM65XX),
+    ("sun4i-a10", chips.A10),
+    ("sun7i-a20", chips.A20),
+    ("amlogic,g12a", chips.S905Y2),
+    ("amlogic, g12a", chips.S905X3),
+    ("sun8i-h3", chips.H3),
+    ("qcom,apq8016", chips.APQ8016),
+    ("fu500", chips.HFU540),
+    ("sun20iw1p1", chips.C906),
+    # Older Builds
+    ("sifive", chips.JH71X0),
+    # Newer Builds
+    ("jh7100", chips.JH71X0),
+    ("jh7110", chips.JH7110),
+    ("sun8i-a33", chips.A33),
+    ("rockchip,rk3308", chips.RK3308),
+    ("radxa,rock-4c-plus", chips.RK3399_T),
+    ("rockchip,rk3399pro", chips.RK3399PRO),
+    ("rockchip,rk3399", chips.RK3399),
+    ("rockchip,rk3288", chips.RK3288),
+    ("rockchip,rk3328", chips.RK3328),
+    ("rockchip,rk3566", chips.RK3566),
+    ("rockchip,rk3568", chips.RK3568),
+    ("rockchip,rk3588s", chips.RK3588S),
+    ("rockchip,rk3588", chips.RK3588),
+    ("rockchip,rv1106", chips.RV1106),
+    ("rockchip,rv1103", chips.RV1103),
+    ("amlogic,a311d", chips.A311D),
+    ("st,stm32mp157", chips.STM32MP157),
+    ("st,stm32mp153", chips.STM32MP157DAA1),
+    ("sun50i-a64", chips.A64),
+    ("sun50i-h5", chips.H5),
+    ("sun50i-h618", chips.H618),
+    ("sun50i-h616", chips.H616),
+    ("sun50iw9", chips.H616),
+    ("sun50i-h6", chips.H6),
+    ("sun55iw3", chips.T527),
+    ("spacemit,k1-x", chips.K1),
+    ("renesas,r9a09g056", chips.RZV2N),
+    ("renesas,r9a09g057", chips.RZV2H),
+    ("mediatek,mt8167", chips.MT8167),
+    ("imx6ull", chips.IMX6ULL),
+    ("ti,j721e", chips.TDA4VM),
+    ("sun20i-d1", chips.D1_RISCV),
+    ("imx8mp", chips.IMX8MP),
+    ("libretech,aml-s905x-cc", chips.S905X),
+    ("light-lpi4a", chips.TH1520),
+    ("hobot,x3", chips.SUNRISE_X3),
+    ("Horizon, x5", chips.SUNRISE_X5),
+    ("particle,tachyon", chips.QCM6490),
+    ("brcm,bcm2", chips.BCM2XXX),
+    ("hardkernel,odroid-xu4", chips.EXYNOS5422),
+)
+
+_DT_COMPATIBLE_MATCHER = CompatibleMatcher(_DT_COMPATIBLE_CHIPS)
+
+# Marks a cache slot that has not been filled yet, so a detected None is cached
+_UNSET = object()
+
+# Every name chip.<NAME> is expected to be asked about: the chip constants and
+# the chip ids they stand for
+_CHIP_NAMES = frozenset(
+    name
+    for constant, value in vars(chips).items()
+    if constant.isupper() and isinstance(value, str)
+    for name in (constant, value)
+)
+
 
 class Chip:
     """Attempt detection of current chip / CPU."""
 
     def __init__(self, detector) -> None:
         self.detector = detector
-        self._chip_id = None
+        self._chip_id = _UNSET
+        self._flag_names = ()  # type: Iterable[str]
 
     # pylint: disable=invalid-name,too-many-branches,too-many-return-statements
     @property
@@ -46,144 +125,95 @@ class Chip:
         self,
     ) -> Optional[str]:
         """Return a unique id for the detected chip, if any."""
-        # There are some times we want to trick the platform detection
-        # say if a raspberry pi doesn't have the right ID, or for testing
-
-        # Caching
-        if self._chip_id:
+        # Caching, including a previous "nothing found"
+        if self._chip_id is not _UNSET:
             return self._chip_id
 
-        if getattr(os, "environ", None) is not None:
-            try:
-                return os.environ["BLINKA_FORCECHIP"]
-            except KeyError:  # no forced chip, continue with testing!
-                pass
-
-            # Special cases controlled by environment var
-            if os.environ.get("BLINKA_FT232H"):
-                from pyftdi.usbtools import UsbTools
-
-                # look for it based on PID/VID
-                count = len(UsbTools.find_all([(0x0403, 0x6014)]))
-                if count == 0:
-                    raise RuntimeError(
-                        "BLINKA_FT232H environment variable "
-                        + "set, but no FT232H device found"
-                    )
-                self._chip_id = chips.FT232H
-                return self._chip_id
-            if os.environ.get("BLINKA_FT2232H"):
-                from pyftdi.usbtools import UsbTools
-
-                # look for it based on PID/VID
-                count = len(UsbTools.find_all([(0x0403, 0x6010)]))
-                if count == 0:
-                    raise RuntimeError(
-                        "BLINKA_FT2232H environment variable "
-                        + "set, but no FT2232H device found"
-                    )
-                self._chip_id = chips.FT2232H
-                return self._chip_id
-            if os.environ.get("BLINKA_FT4232H"):
-                from pyftdi.usbtools import UsbTools
-
-                # look for it based on PID/VID
-                count = len(UsbTools.find_all([(0x0403, 0x6011)]))
-                if count == 0:
+        tracer = self.detector.tracer
+        if tracer is None:
+            return self._find_id()[1]
+        start = tracer.now()
+        source, chip_id = self._find_id()
+        tracer.record("chip.id", source, chip_id, start)
+        return chip_id
+
+    def _find_id(self) -> Tuple[str, Optional[str]]:
+        """Return the chip id and the setting or platform that decided it."""
+        environ = self.detector.environ
+        if environ is not None:
+            tracer = self.detector.tracer
+            if tracer is not None:
+                start = tracer.now()
+            found = self._environ_id(environ)
+            if found is not None:
+                setting, chip_id = found
+                if tracer is not None:
+                    tracer.record("environ", setting, chip_id, start)
+                # A chip forced through BLINKA_FORCECHIP is not cached
+                if setting != "BLINKA_FORCECHIP":
+                    self._chip_id = chip_id
+                return setting, chip_id
+
+        platform = self.detector.platform
+        return "platform " + platform, self._platform_id(platform)
+
+    def _environ_id(self, environ: Mapping[str, str]) -> Optional[Tuple[str, str]]:
+        """Return the ``BLINKA_*`` setting choosing the chip and its id, if any."""
+        # There are some times we want to trick the platform detection
+        # say if a raspberry pi doesn't have the right ID, or for testing
+        try:
+            return "BLINKA_FORCECHIP", environ["BLINKA_FORCECHIP"]
+        except KeyError:  # no forced chip, continue with testing!
+            pass
+
+        # Special cases controlled by environment var
+        for ftdi_chip in (chips.FT232H, chips.FT2232H, chips.FT4232H):
+            if environ.get("BLINKA_" + ftdi_chip):
+                # look for it based on PID/VID, a single scan finds every
+                # FTDI variant
+                if not self.detector.get_usb_devices().find_ftdi(ftdi_chip):
                     raise RuntimeError(
-                        "BLINKA_FT4232H environment variable "
-                        + "set, but no FT4232H device found"
+                        "BLINKA_{0} environment variable ".format(ftdi_chip)
+                        + "set, but no {0} device found".format(ftdi_chip)
                     )
-                self._chip_id = chips.FT4232H
-                return self._chip_id
-            if os.environ.get("BLINKA_MCP2221"):
-                import hid
-
-                # look for it based on PID/VID
-                for dev in hid.enumerate():
-                    if dev["vendor_id"] == 0x04D8 and dev["product_id"] == 0x00DD:
-                        self._chip_id = chips.MCP2221
-                        return self._chip_id
-                raise RuntimeError(
-                    "BLINKA_MCP2221 environment variable "
-                    + "set, but no MCP2221 device found"
-                )
-            if os.environ.get("BLINKA_SPIDRIVER"):
-                self._chip_id = chips.SPIDRIVER
-                return self._chip_id
-            if os.environ.get("BLINKA_OS_AGNOSTIC"):
-                # we don't need to look for this chip, it's just a flag
-                self._chip_id = chips.OS_AGNOSTIC
-                return self._chip_id
-            if os.environ.get("BLINKA_U2IF"):
-                import hid
-
-                # look for it based on PID/VID
-                for dev in hid.enumerate():
-                    vendor = dev["vendor_id"]
-                    product = dev["product_id"]
-                    # NOTE: If any products are added here, they need added
-                    # to _rp2040_u2if_id() in board.py as well.
-                    # pylint: disable=too-many-boolean-expressions
-                    if (
-                        (
-                            # Raspberry Pi Pico
-                            # Radxa X4
-                            vendor in (0xCAFE, 0xCAFF)
-                            and product == 0x4005
-                        )
-                        or (
-                            # Waveshare RP2040 One
-                            vendor == 0x2E8A
-                            and product == 0x103A
-                        )
-                        or (
-                            # Feather RP2040
-                            # Itsy Bitsy RP2040
-                            # QT Py RP2040
-                            # QT2040 Trinkey
-                            # MacroPad RP2040
-                            # Feather RP2040 ThinkInk
-                            # Feather RP2040 RFM
-                            # Feather RP2040 CAN Bus
-                            vendor == 0x239A
-                            and product
-                            in (
-                                0x00F1,
-                                0x00FD,
-                                0x00F7,
-                                0x0109,
-                                0x0107,
-                                0x812C,
-                                0x812E,
-                                0x8130,
-                                0x0105,
-                            )
-                        )
-                    ):
-                        self._chip_id = chips.RP2040_U2IF
-                        return self._chip_id
-                raise RuntimeError(
-                    "BLINKA_U2IF environment variable "
-                    + "set, but no compatible device found"
-                )
-            if os.environ.get("BLINKA_GREATFET"):
-                import usb
-
-                if usb.core.find(idVendor=0x1D50, idProduct=0x60E6) is not None:
-                    self._chip_id = chips.LPC4330
-                    return self._chip_id
-                raise RuntimeError(
-                    "BLINKA_GREATFET environment variable "
-                    + "set, but no GreatFET device found"
-                )
-            if os.environ.get("BLINKA_NOVA"):
-                self._chip_id = chips.BINHO
-                return self._chip_id
-
-        platform = sys.platform
+                return "BLINKA_" + ftdi_chip, ftdi_chip
+        if environ.get("BLINKA_MCP2221"):
+            # look for it based on PID/VID
+            if self.detector.get_usb_devices().find_hid(chips.MCP2221):
+                return "BLINKA_MCP2221", chips.MCP2221
+            raise RuntimeError(
+                "BLINKA_MCP2221 environment variable "
+                + "set, but no MCP2221 device found"
+            )
+        if environ.get("BLINKA_SPIDRIVER"):
+            return "BLINKA_SPIDRIVER", chips.SPIDRIVER
+        if environ.get("BLINKA_OS_AGNOSTIC"):
+            # we don't need to look for this chip, it's just a flag
+            return "BLINKA_OS_AGNOSTIC", chips.OS_AGNOSTIC
+        if environ.get("BLINKA_U2IF"):
+            # look for it based on PID/VID, the board is then told apart
+            # from the same enumeration
+            if self.detector.get_usb_devices().find_hid(chips.RP2040_U2IF):
+                return "BLINKA_U2IF", chips.RP2040_U2IF
+            raise RuntimeError(
+                "BLINKA_U2IF environment variable "
+                + "set, but no compatible device found"
+            )
+        if environ.get("BLINKA_GREATFET"):
+            # look for it based on PID/VID
+            if self.detector.get_usb_devices().find_usb(chips.LPC4330):
+                return "BLINKA_GREATFET", chips.LPC4330
+            raise RuntimeError(
+                "BLINKA_GREATFET environment variable "
+                + "set, but no GreatFET device found"
+            )
+        if environ.get("BLINKA_NOVA"):
+            return "BLINKA_NOVA", chips.BINHO
+        return None
+
+    def _platform_id(self, platform: str) -> Optional[str]:
         if platform in ("linux", "linux2"):
-            self._chip_id = self._linux_id()
+            self._chip_id = self.detector.cached_result("chip_id", self._linux_id)
             return self._chip_id
         if platform == "esp8266":
             self._chip_id = chips.ESP8266
@@ -201,174 +231,50 @@ class Chip:
             self._chip_id = chips.RP2040
             return self._chip_id
         # nothing found!
+        self._chip_id = None
         return None
 
     # pylint: enable=invalid-name
 
+    def invalidate(self) -> None:
+        """Forget the cached chip id so the next access detects it again."""
+        self._chip_id = _UNSET
+        for name in self._flag_names:
+            del self.__dict__[name]
+        self._flag_names = ()
+
     def _linux_id(self) -> Optional[str]:
+        """Attempt to detect the CPU on a computer running the Linux kernel."""
+        tracer = self.detector.tracer
+        if tracer is None:
+            chip_id = _DT_COMPATIBLE_MATCHER.match(self.detector.get_dt_compatible())
+            if chip_id is not None:
+                return chip_id
+            return self._linux_fallback_id()
+
+        start = tracer.now()
+        compatible = self.detector.get_dt_compatible()
+        index = _DT_COMPATIBLE_MATCHER.first_index(compatible.text)
+        if index is None:
+            result = "no match"
+        else:
+            pattern, chip_id = _DT_COMPATIBLE_MATCHER.rules[index]
+            result = "rule {} of {}, {!r}: {}".format(
+                index + 1, len(_DT_COMPATIBLE_MATCHER.rules), pattern, chip_id
+            )
+        tracer.record("dt-compatible", "/proc/device-tree/compatible", result, start)
+        if index is not None:
+            return chip_id
+
+        start = tracer.now()
+        chip_id = self._linux_fallback_id()
+        tracer.record("chip-fallback", "/proc/cpuinfo", chip_id, start)
+        return chip_id
+
+    def _linux_fallback_id(self) -> Optional[str]:
         # pylint: disable=too-many-branches,too-many-statements
         # pylint: disable=too-many-return-statements
-        """Attempt to detect the CPU on a computer running the Linux kernel."""
-        if self.detector.check_dt_compatible_value("beagle,am67a-beagley-ai"):
-            return chips.AM67A
-        if self.detector.check_dt_compatible_value("beagle,am62-pocketbeagle2ti,am625"):
-            return chips.AM625X
-        if self.detector.check_dt_compatible_value("ti,am625"):
-            return chips.AM625X
-        if self.detector.check_dt_compatible_value("ti,am654"):
-            return chips.AM65XX
-
-        if self.detector.check_dt_compatible_value("ti,am652"):
-            return chips.AM65XX
-
-        if self.detector.check_dt_compatible_value("sun4i-a10"):
-            return chips.A10
-
-        if self.detector.check_dt_compatible_value("sun7i-a20"):
-            return chips.A20
-
-        if self.detector.check_dt_compatible_value("amlogic,g12a"):
-            return chips.S905Y2
-        if self.detector.check_dt_compatible_value("amlogic, g12a"):
-            return chips.S905X3
-
-        if self.detector.check_dt_compatible_value("sun8i-h3"):
-            return chips.H3
-
-        if self.detector.check_dt_compatible_value("qcom,apq8016"):
-            return chips.APQ8016
-
-        if self.detector.check_dt_compatible_value("fu500"):
-            return chips.HFU540
-
-        if self.detector.check_dt_compatible_value("sun20iw1p1"):
-            return chips.C906
-
-        # Older Builds
-        if self.detector.check_dt_compatible_value("sifive"):
-            return chips.JH71X0
-
-        # Newer Builds
-        if self.detector.check_dt_compatible_value("jh7100"):
-            return chips.JH71X0
-
-        if self.detector.check_dt_compatible_value("jh7110"):
-            return chips.JH7110
-
-        if self.detector.check_dt_compatible_value("sun8i-a33"):
-            return chips.A33
-
-        if self.detector.check_dt_compatible_value("rockchip,rk3308"):
-            return chips.RK3308
-
-        if self.detector.check_dt_compatible_value("radxa,rock-4c-plus"):
-            return chips.RK3399_T
-
-        if self.detector.check_dt_compatible_value("rockchip,rk3399pro"):
-            return chips.RK3399PRO
-
-        if self.detector.check_dt_compatible_value("rockchip,rk3399"):
-            return chips.RK3399
-
-        if self.detector.check_dt_compatible_value("rockchip,rk3288"):
-            return chips.RK3288
-
-        if self.detector.check_dt_compatible_value("rockchip,rk3328"):
-            return chips.RK3328
-
-        if self.detector.check_dt_compatible_value("rockchip,rk3566"):
-            return chips.RK3566
-
-        if self.detector.check_dt_compatible_value("rockchip,rk3568"):
-            return chips.RK3568
-
-        if self.detector.check_dt_compatible_value("rockchip,rk3588s"):
-            return chips.RK3588S
-
-        if self.detector.check_dt_compatible_value("rockchip,rk3588"):
-            return chips.RK3588
-
-        if self.detector.check_dt_compatible_value("rockchip,rv1106"):
-            return chips.RV1106
-
-        if self.detector.check_dt_compatible_value("rockchip,rv1103"):
-            return chips.RV1103
-
-        if self.detector.check_dt_compatible_value("amlogic,a311d"):
-            return chips.A311D
-
-        if self.detector.check_dt_compatible_value("st,stm32mp157"):
-            return chips.STM32MP157
-
-        if self.detector.check_dt_compatible_value("st,stm32mp153"):
-            return chips.STM32MP157DAA1
-
-        if self.detector.check_dt_compatible_value("sun50i-a64"):
-            return chips.A64
-
-        if self.detector.check_dt_compatible_value("sun50i-h5"):
-            return chips.H5
-
-        if self.detector.check_dt_compatible_value("sun50i-h618"):
-            return chips.H618
-
-        if self.detector.check_dt_compatible_value("sun50i-h616"):
-            return chips.H616
-
-        if self.detector.check_dt_compatible_value("sun50iw9"):
-            return chips.H616
-
-        if self.detector.check_dt_compatible_value("sun50i-h6"):
-            return chips.H6
-
-        if self.detector.check_dt_compatible_value("sun55iw3"):
-            return chips.T527
-
-        if self.detector.check_dt_compatible_value("spacemit,k1-x"):
-            return chips.K1
-
-        if self.detector.check_dt_compatible_value("renesas,r9a09g056"):
-            return chips.RZV2N
-
-        if self.detector.check_dt_compatible_value("renesas,r9a09g057"):
-            return chips.RZV2H
-
-        if self.detector.check_dt_compatible_value("mediatek,mt8167"):
-            return chips.MT8167
-
-        if self.detector.check_dt_compatible_value("imx6ull"):
-            return chips.IMX6ULL
-
-        if self.detector.check_dt_compatible_value("ti,j721e"):
-            return chips.TDA4VM
-
-        if self.detector.check_dt_compatible_value("sun20i-d1"):
-            return chips.D1_RISCV
-
-        if self.detector.check_dt_compatible_value("imx8mp"):
-            return chips.IMX8MP
-
-        if self.detector.check_dt_compatible_value("libretech,aml-s905x-cc"):
-            return chips.S905X
-
-        if self.detector.check_dt_compatible_value("light-lpi4a"):
-            return chips.TH1520
-
-        if self.detector.check_dt_compatible_value("hobot,x3"):
-            return chips.SUNRISE_X3
-
-        if self.detector.check_dt_compatible_value("Horizon, x5"):
-            return chips.SUNRISE_X5
-
-        if self.detector.check_dt_compatible_value("particle,tachyon"):
-            return chips.QCM6490
-
-        if self.detector.check_dt_compatible_value("brcm,bcm2"):
-            return chips.BCM2XXX
-
-        if self.detector.check_dt_compatible_value("hardkernel,odroid-xu4"):
-            return chips.EXYNOS5422
-
+        """Detect the CPU from cpuinfo and the compatible checks no rule covers."""
         linux_id = None
         hardware = self.detector.get_cpuinfo_field("Hardware")
 
@@ -398,27 +304,24 @@ class Chip:
                     linux_id = chips.GENERIC_X86
             ##            print("linux_id = ", linux_id)
 
-            compatible = self.detector.get_device_compatible()
-            if compatible and "tegra" in compatible:
-                compats = compatible.split("\x00")
-                if "nvidia,tegra210" in compats:
+            compatible = self.detector.get_dt_compatible()
+            if "tegra" in compatible:
+                if compatible.has_entry("nvidia,tegra210"):
                     linux_id = chips.T210
-                elif "nvidia,tegra186" in compats:
+                elif compatible.has_entry("nvidia,tegra186"):
                     linux_id = chips.T186
-                elif "nvidia,tegra194" in compats:
+                elif compatible.has_entry("nvidia,tegra194"):
                     linux_id = chips.T194
-                elif "nvidia,tegra234" in compats:
+                elif compatible.has_entry("nvidia,tegra234"):
                     linux_id = chips.T234
-                elif "nvidia,tegra264" in compats:
+                elif compatible.has_entry("nvidia,tegra264"):
                     linux_id = chips.T264
-            if compatible and "imx8m" in compatible:
+            if "imx8m" in compatible:
                 linux_id = chips.IMX8MX
-            if compatible and "odroid-c2" in compatible:
+            if "odroid-c2" in compatible:
                 linux_id = chips.S905
-            if compatible and "amlogic" in compatible:
-                compatible_list = (
-                    compatible.replace("\x00", ",").replace(" ", "").split(",")
-                )
+            if "amlogic" in compatible:
+                compatible_list = compatible.tokens
                 if "g12a" in compatible_list:
                     # 'sm1' is correct for S905X3, but some kernels use 'g12a'
                     return chips.S905X3
@@ -428,15 +331,15 @@ class Chip:
                     return chips.S905X3
                 if "vim3amlogic" in compatible_list:
                     return chips.A311D
-            if compatible and "sun50i-a64" in compatible:
+            if "sun50i-a64" in compatible:
                 linux_id = chips.A64
-            if compatible and "sun50i-h6" in compatible:
+            if "sun50i-h6" in compatible:
                 linux_id = chips.H6
-            if compatible and "sun50i-h5" in compatible:
+            if "sun50i-h5" in compatible:
                 linux_id = chips.H5
-            if compatible and "cvitek,cv180x" in compatible:
+            if "cvitek,cv180x" in compatible:
                 linux_id = chips.CV1800B
-            if compatible and "xlnx,zynqmp" in compatible:
+            if "xlnx,zynqmp" in compatible:
                 linux_id = chips.ZYNQMP
 
             cpu_model = self.detector.get_cpuinfo_field("cpu model")
@@ -452,7 +355,8 @@ class Chip:
             if not linux_id:
                 if compatible:
                     hardware = [
-                        entry.replace("\x00", "") for entry in compatible.split(",")
+                        entry.replace("\x00", "")
+                        for entry in compatible.text.split(",")
                     ]
                 else:
                     hardware = []
@@ -487,8 +391,7 @@ class Chip:
             elif "ASUS_TINKER_BOARD" in hardware:
                 linux_id = chips.RK3288
             elif "Xilinx Zynq" in hardware:
-                compatible = self.detector.get_device_compatible()
-                if compatible and "xlnx,zynq-7000" in compatible:
+                if "xlnx,zynq-7000" in self.detector.get_dt_compatible():
                     linux_id = chips.ZYNQ7000
             else:
                 if isinstance(hardware, str):
@@ -504,9 +407,28 @@ class Chip:
         """
         Detect whether the given attribute is the currently-detected chip.  See
         list of constants at the top of this module for available options.
+
+        Once the chip is detected, every chip constant is stored as a plain
+        attribute, so later checks do not come back here. With the detector
+        in strict mode, a name that is not a chip constant raises
+        :class:`AttributeError` instead of returning ``False``.
         """
         if attr == "id":
             raise AttributeError("id")  # Avoid infinite recursion
-        if self.id == attr:
-            return True
-        return False
+        chip_id = self.id
+        if attr == chip_id:
+            result = True
+        elif attr in _CHIP_NAMES:
+            result = False
+        elif self.detector.strict:
+            raise AttributeError("{!r} is not a known chip".format(attr))
+        else:
+            return False
+        # A chip forced through BLINKA_FORCECHIP is not cached
+        if self._chip_id is not _UNSET and not self._flag_names:
+            flags = dict.fromkeys(_CHIP_NAMES, False)
+            if isinstance(chip_id, str):
+                flags[chip_id] = True
+            self.__dict__.update(flags)
+            self._flag_names = tuple(flags)
+        return result
@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_platformdetect.cpuinfo`
+================================================================================
+
+Parsed index of /proc/cpuinfo
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Linux and Python 3.7 or Higher
+
+"""
+
+try:
+    from typing import Dict, Optional, Tuple
+except ImportError:
+    pass
+
+# Compiled on first use by _field_re(), so importing the package does not
+# load re
+_FIELD_RE = None
+
+
+def _field_re():
+    """Return the pattern of a line like 'Hardware   : BCM2709'.
+
+    Whitespace is required on both sides of the separator and never spans
+    lines.
+    """
+    global _FIELD_RE  # pylint: disable=global-statement
+    if _FIELD_RE is None:
+        import re
+
+        _FIELD_RE = re.compile(r"^([^:\n]*[^\s:])[^\S\n]+:[^\S\n]+(.*)$", re.MULTILINE)
+    return _FIELD_RE
+
+
+class CpuInfo:
+    """Index of the ``key : value`` lines of /proc/cpuinfo.
+
+    The field index is built in a single pass over the text. Keys are
+    case-folded and the first occurrence of each key wins, so lookups return
+    the same value the old per-call line scan found. On a 128 core x86 host
+    (about 220 KB of text) building the index takes a few milliseconds and
+    keeps only a few dozen entries.
+
+    The per-processor blocks (separated by blank lines) are only split out
+    when :attr:`processors` is first used; values repeated across blocks, such
+    as the x86 ``flags`` line, are stored once and shared between blocks.
+    """
+
+    __slots__ = ("fields", "_text", "_processors")
+
+    def __init__(self, text: str) -> None:
+        fields = {}  # type: Dict[str, str]
+        # Walk backwards so the first occurrence of a key is written last
+        for key, value in reversed(_field_re().findall(text)):
+            fields[key.casefold()] = value
+        self.fields = fields
+        self._text = text
+        self._processors = None
+
+    def __contains__(self, field: str) -> bool:
+        return field.casefold() in self.fields
+
+    def get(self, field: str) -> Optional[str]:
+        """Return the first value of ``field``, ignoring case, or None."""
+        return self.fields.get(field.casefold())
+
+    @property
+    def processors(self) -> Tuple[Dict[str, str], ...]:
+        """The fields of each block of /proc/cpuinfo, in file order.
+
+        On ARM the last block usually holds board-wide fields such as
+        ``Hardware`` and ``Revision`` rather than a processor.
+        """
+        if self._processors is None:
+            shared = {}  # type: Dict[str, str]
+            processors = []
+            field_re = _field_re()
+            for block in self._text.split("\n\n"):
+                fields = {}
+                for key, value in field_re.findall(block):
+                    fields.setdefault(key.casefold(), shared.setdefault(value, value))
+                if fields:
+                    processors.append(fields)
+            self._processors = tuple(processors)
+            self._text = None
+        return self._processors
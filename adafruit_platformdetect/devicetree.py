@@ -0,0 +1,113 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_platformdetect.devicetree`
+================================================================================
+
+Parsed views of the Linux device tree
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Linux and Python 3.7 or Higher
+
+"""
+
+try:
+    from typing import Any, Optional, Sequence, Tuple
+except ImportError:
+    pass
+
+
+class DeviceTreeCompatible:
+    """Snapshot of /proc/device-tree/compatible.
+
+    The file is a list of NUL-separated strings such as
+    ``raspberrypi,4-model-b\\x00brcm,bcm2711\\x00``. It is read once and kept
+    as the raw bytes, the decoded text, a tuple of entries and a frozenset of
+    entries for exact lookups. ``value in snapshot`` keeps the substring
+    semantics of :meth:`Detector.check_dt_compatible_value`. All attributes are
+    immutable values and are shared by every chip and board check.
+    """
+
+    __slots__ = ("raw", "text", "entries", "tokens", "_entry_set")
+
+    def __init__(self, raw: Optional[bytes]) -> None:
+        self.raw = raw
+        self.text = None if raw is None else raw.decode("utf-8")
+        self.entries = tuple(self.text.rstrip("\x00").split("\x00")) if raw else ()
+        self._entry_set = frozenset(self.entries)
+        # Some kernels use "amlogic, g12a" style entries, so vendor and SoC
+        # names are also matched individually with spaces removed.
+        self.tokens = frozenset(
+            token.replace(" ", "")
+            for entry in self.entries
+            for token in entry.split(",")
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.text)
+
+    def __contains__(self, value: str) -> bool:
+        """Substring search over the whole compatible blob."""
+        return bool(self.text) and value in self.text
+
+    def __repr__(self) -> str:
+        return "DeviceTreeCompatible({!r})".format(self.raw)
+
+    def has_entry(self, value: str) -> bool:
+        """Return True if ``value`` is exactly one of the compatible entries."""
+        return value in self._entry_set
+
+
+class CompatibleMatcher:
+    """Find the highest priority rule contained in a compatible blob.
+
+    ``rules`` is an ordered sequence of ``(substring, value)`` pairs. All the
+    substrings are compiled into a single alternation, so one scan of the
+    blob replaces a substring test per rule. The result is the same as
+    testing each rule in order and stopping at the first one found.
+    """
+
+    def __init__(self, rules: Sequence[Tuple[str, Any]]) -> None:
+        self.rules = tuple(rules)
+        self._priority = {}
+        for index, (pattern, _) in enumerate(self.rules):
+            self._priority.setdefault(pattern, index)
+        self._regex = None
+
+    def first_index(self, text: Optional[str]) -> Optional[int]:
+        """Return the index of the first rule found in ``text``, if any."""
+        if not text:
+            return None
+        if self._regex is None:
+            # Compiled on first use, not at import, since most processes only
+            # ever detect once and some platforms never get here at all.
+            import re
+
+            # Alternatives are tried in priority order, so where several rules
+            # match at the same position the search reports the best of them.
+            self._regex = re.compile("|".join(re.escape(p) for p in self._priority))
+        best = None
+        position = 0
+        while best != 0:
+            match = self._regex.search(text, position)
+            if match is None:
+                break
+            index = self._priority[match.group()]
+            if best is None or index < best:
+                best = index
+            # Restart just after the match start, so overlapping rules are seen
+            position = match.start() + 1
+        return best
+
+    def match(self, compatible: DeviceTreeCompatible) -> Any:
+        """Return the value of the first rule found in ``compatible``, or None."""
+        index = self.first_index(compatible.text)
+        if index is None:
+            return None
+        return self.rules[index][1]
@@ -0,0 +1,171 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_platformdetect.iostats`
+================================================================================
+
+Accounting of the file reads detection makes
+
+.. code-block:: python
+
+    from adafruit_platformdetect import Detector
+
+    detector = Detector()
+    with detector.collect_io_stats():
+        print(detector.board.id)
+    for path, stats in detector.io_stats().items():
+        print(path, stats)
+
+For each path, glob pattern and directory listed, this records the number of
+attempts to open it, how many of those found no file, the bytes read and the
+total wall time spent in nanoseconds.
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Linux and Python 3.7 or Higher
+
+"""
+
+import time
+
+try:
+    from typing import Any, Dict, List
+except ImportError:
+    pass
+
+
+class PathStats:
+    """Counters for one path or glob pattern."""
+
+    __slots__ = ("opens", "misses", "bytes", "time_ns")
+
+    def __init__(self) -> None:
+        self.opens = 0
+        self.misses = 0
+        self.bytes = 0
+        self.time_ns = 0
+
+    def __repr__(self) -> str:
+        return "PathStats(opens={}, misses={}, bytes={}, time_ns={})".format(
+            self.opens, self.misses, self.bytes, self.time_ns
+        )
+
+    def as_dict(self) -> Dict[str, int]:
+        """Return the counters as a dict."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class IOStats:
+    """Per path counters, filled in by a :class:`CountingFilesystem`."""
+
+    def __init__(self) -> None:
+        self.paths = {}  # type: Dict[str, PathStats]
+
+    def __getitem__(self, path: str) -> PathStats:
+        try:
+            return self.paths[path]
+        except KeyError:
+            stats = self.paths[path] = PathStats()
+            return stats
+
+    def totals(self) -> PathStats:
+        """Return the counters summed over every path."""
+        total = PathStats()
+        for stats in self.paths.values():
+            total.opens += stats.opens
+            total.misses += stats.misses
+            total.bytes += stats.bytes
+            total.time_ns += stats.time_ns
+        return total
+
+    def as_dict(self) -> Dict[str, Dict[str, int]]:
+        """Return ``{path: counters}`` in the order paths were first used."""
+        return {path: stats.as_dict() for path, stats in self.paths.items()}
+
+
+class CountingFilesystem:
+    """Pass calls through to ``backend``, counting them in ``stats``."""
+
+    def __init__(self, backend: Any, stats: IOStats) -> None:
+        self.backend = backend
+        self.stats = stats
+        self.live = backend.live
+
+    def _read(self, method: Any, path: str, *args: Any) -> Any:
+        stats = self.stats[path]
+        stats.opens += 1
+        start = time.perf_counter_ns()
+        try:
+            data = method(path, *args)
+        except FileNotFoundError:
+            stats.misses += 1
+            raise
+        finally:
+            stats.time_ns += time.perf_counter_ns() - start
+        stats.bytes += len(data)
+        return data
+
+    def read_bytes(self, path: str, size: int = -1) -> bytes:
+        """Read ``path`` from the backend, counting the call."""
+        return self._read(self.backend.read_bytes, path, size)
+
+    def read_text(self, path: str) -> str:
+        """Read ``path`` from the backend, counting the call."""
+        return self._read(self.backend.read_text, path)
+
+    def exists(self, path: str) -> bool:
+        """Check ``path`` in the backend, counting a missing path as a miss."""
+        stats = self.stats[path]
+        stats.opens += 1
+        start = time.perf_counter_ns()
+        found = self.backend.exists(path)
+        stats.time_ns += time.perf_counter_ns() - start
+        if not found:
+            stats.misses += 1
+        return found
+
+    def glob(self, pattern: str) -> List[str]:
+        """Run ``pattern`` in the backend, counting no matches as a miss."""
+        stats = self.stats[pattern]
+        stats.opens += 1
+        start = time.perf_counter_ns()
+        matches = self.backend.glob(pattern)
+        stats.time_ns += time.perf_counter_ns() - start
+        if not matches:
+            stats.misses += 1
+        return matches
+
+    def listdir(self, path: str) -> List[str]:
+        """List ``path`` in the backend, counting a missing one as a miss."""
+        stats = self.stats[path]
+        stats.opens += 1
+        start = time.perf_counter_ns()
+        try:
+            return self.backend.listdir(path)
+        except FileNotFoundError:
+            stats.misses += 1
+            raise
+        finally:
+            stats.time_ns += time.perf_counter_ns() - start
+
+
+class IOStatsCollector:
+    """Context manager that counts the reads of a detector while active."""
+
+    def __init__(self, detector: Any) -> None:
+        self.detector = detector
+        self.stats = IOStats()
+        self._backend = None
+
+    def __enter__(self) -> IOStats:
+        self._backend = self.detector.sysroot
+        self.detector.sysroot = CountingFilesystem(self._backend, self.stats)
+        return self.stats
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.detector.sysroot = self._backend
@@ -22,6 +22,11 @@ documentation/asciidoc/computers/raspberry-pi/revision-codes.adoc#new-style-revi
 
 """
 
+import functools
+import itertools
+
+from adafruit_platformdetect.constants import boards
+
 NEW_OVERVOLTAGE = (
     "Overvoltage allowed",
     "Overvoltage disallowed",
@@ -155,18 +160,91 @@ OLD_REV_LUT = {
 }
 
 
+# Decoders are immutable, so one is shared by every lookup of the same code
+_DECODER_CACHE_SIZE = 256
+
+# Fields of PiDecoder.as_dict() and decode_batch(), named as the properties
+FIELDS = (
+    "overvoltage",
+    "otp_program",
+    "otp_read",
+    "warranty_bit",
+    "rev_style",
+    "memory_size",
+    "manufacturer",
+    "processor",
+    "type",
+    "type_raw",
+    "revision",
+)
+
+
+class _DecodeError:  # pylint: disable=too-few-public-methods
+    """An error found while decoding, raised again when the field is read."""
+
+    __slots__ = ("error_type", "args")
+
+    def __init__(self, error):
+        # Only the type and arguments are kept, raising the same instance
+        # again would grow its traceback every time
+        self.error_type = type(error)
+        self.args = error.args
+
+
 class PiDecoder:
-    """Raspberry Pi Revision Code Decoder"""
+    """Raspberry Pi Revision Code Decoder
+
+    Every field is decoded once, when the decoder is created. A field with an
+    invalid value raises the same error each time it is read. Decoders can
+    not be changed, use :func:`get_decoder` to share one per revision code.
+    """
+
+    __slots__ = ("rev_code", "_new_format", "_valid", "_fields")
 
     def __init__(self, rev_code):
         try:
-            self.rev_code = int(rev_code, 16) & 0xFFFFFFFF
+            value = int(rev_code, 16) & 0xFFFFFFFF
         except ValueError:
-            print("Invalid revision code. It should be a hexadecimal value.")
+            raise ValueError(
+                "Invalid revision code. It should be a hexadecimal value."
+            ) from None
+        self.rev_code = value
+        self._new_format = self._get_rev_prop_value("rev_style", raw=True) == 1
+        self._valid = self._check_valid_code()
+        fields = {"rev_style": self._get_rev_prop_value("rev_style")}
+        for name in NEW_REV_STRUCTURE:
+            if name != "rev_style":
+                fields[name] = self._decode(name)
+        fields["type_raw"] = self._decode("type", raw=True)
+        # Set last, the decoder can not be changed from here on
+        self._fields = fields
+
+    def __setattr__(self, name, value):
+        if hasattr(self, "_fields"):
+            raise AttributeError("PiDecoder is immutable")
+        super().__setattr__(name, value)
+
+    def __repr__(self):
+        return "PiDecoder({:x})".format(self.rev_code)
+
+    def _decode(self, name, raw=False):
+        try:
+            return self._get_property(name, raw=raw)
+        except (ValueError, IndexError, KeyError) as error:
+            return _DecodeError(error)
+
+    def _field(self, name):
+        value = self._fields[name]
+        if isinstance(value, _DecodeError):
+            raise value.error_type(*value.args)
+        return value
 
     def is_valid_code(self):
         """Quickly check the validity of a code"""
-        if self.is_new_format():
+        return self._valid
+
+    def _check_valid_code(self):
+        if self._new_format:
             for code_format in NEW_REV_STRUCTURE.values():
                 lower_bit, bit_size, values = code_format
                 prop_value = (self.rev_code >> lower_bit) & ((1 << bit_size) - 1)
@@ -237,7 +315,7 @@ class PiDecoder:
     def _get_property(self, name, raw=False):
         if name not in NEW_REV_STRUCTURE:
             raise ValueError(f"Unknown property {name}")
-        if self.is_new_format():
+        if self._new_format:
             return self._get_rev_prop_value(name, raw=raw)
         if name in OLD_REV_EXTRA_PROPS:
             return self._get_rev_prop_value(
@@ -247,60 +325,396 @@ class PiDecoder:
 
     def is_new_format(self):
         """Check if the code is in the new format"""
-        return self._get_rev_prop_value("rev_style", raw=True) == 1
+        return self._new_format
+
+    def as_dict(self):
+        """Return every field in :data:`FIELDS`, None for the invalid ones"""
+        fields = {}
+        for name in FIELDS:
+            value = self._fields["warranty" if name == "warranty_bit" else name]
+            fields[name] = None if isinstance(value, _DecodeError) else value
+        return fields
 
     @property
     def overvoltage(self):
         """Overvoltage allowed/disallowed"""
-        return self._get_property("overvoltage")
+        return self._field("overvoltage")
 
     @property
     def warranty_bit(self):
         """Warranty bit"""
-        return self._get_property("warranty")
+        return self._field("warranty")
 
     @property
     def otp_program(self):
         """OTP programming allowed/disallowed"""
-        return self._get_property("otp_program")
+        return self._field("otp_program")
 
     @property
     def otp_read(self):
         """OTP reading allowed/disallowed"""
-        return self._get_property("otp_read")
+        return self._field("otp_read")
 
     @property
     def rev_style(self):
         """Revision Code style"""
-        # Force new style for Rev Style
-        return self._get_rev_prop_value("rev_style")
+        # Always decoded as a new style code
+        return self._field("rev_style")
 
     @property
     def memory_size(self):
         """Memory size"""
-        return self._get_property("memory_size")
+        return self._field("memory_size")
 
     @property
     def manufacturer(self):
         """Manufacturer"""
-        return self._get_property("manufacturer")
+        return self._field("manufacturer")
 
     @property
     def processor(self):
         """Processor"""
-        return self._get_property("processor")
+        return self._field("processor")
 
     @property
     def type(self):
         """Specific Model"""
-        return self._get_property("type")
+        return self._field("type")
 
     @property
     def type_raw(self):
         """Raw Value of Specific Model"""
-        return self._get_property("type", raw=True)
+        return self._field("type_raw")
 
     @property
     def revision(self):
         """Revision Number"""
-        return self._get_property("revision")
+        return self._field("revision")
+
+
+@functools.lru_cache(maxsize=_DECODER_CACHE_SIZE)
+def get_decoder(rev_code):
+    """
+    Return the :class:`PiDecoder` of ``rev_code``, shared by every caller
+    asking for the same code so it is only decoded once.
+    """
+    return PiDecoder(rev_code)
+
+
+def _parse_code(rev_code):
+    if isinstance(rev_code, str):
+        try:
+            return int(rev_code, 16) & 0xFFFFFFFF
+        except ValueError:
+            raise ValueError(
+                "Invalid revision code {!r}. It should be a hexadecimal value.".format(
+                    rev_code
+                )
+            ) from None
+    return int(rev_code) & 0xFFFFFFFF
+
+
+def _decode_python(rev_codes):
+    columns = {name: [] for name in ("rev_code", "valid", "new_format") + FIELDS}
+    rows = {}
+    for rev_code in rev_codes:
+        value = _parse_code(rev_code)
+        row = rows.get(value)
+        if row is None:
+            decoder = PiDecoder("{:x}".format(value))
+            row = rows[value] = {
+                "rev_code": value,
+                "valid": decoder.is_valid_code(),
+                "new_format": decoder.is_new_format(),
+                **decoder.as_dict(),
+            }
+        for name, column in columns.items():
+            column.append(row[name])
+    return columns
+
+
+def _bits(codes, lower_bit, bit_size):
+    return (codes >> lower_bit) & ((1 << bit_size) - 1)
+
+
+def _field_table(numpy, bit_size, values, raw=False):
+    """Return every raw value of a field formatted, None for invalid ones."""
+    table = numpy.full(1 << bit_size, None, dtype=object)
+    for value in range(1 << bit_size):
+        # pylint: disable=protected-access
+        if PiDecoder._valid_value(value, values):
+            table[value] = value if raw else PiDecoder._format_value(value, values)
+    return table
+
+
+def _new_style_lookups(numpy, codes):
+    """
+    Return ``{field: (table, index)}`` and the validity of ``codes`` decoded
+    as new style, ``table[index]`` being the field of each code.
+    """
+    lookups = {}
+    valid = numpy.ones(len(codes), dtype=bool)
+    for name in FIELDS:
+        key = {"warranty_bit": "warranty", "type_raw": "type"}.get(name, name)
+        lower_bit, bit_size, values = NEW_REV_STRUCTURE[key]
+        table = _field_table(numpy, bit_size, values, raw=name == "type_raw")
+        index = _bits(codes, lower_bit, bit_size)
+        valid &= numpy.not_equal(table, None)[index]
+        lookups[name] = table, index
+    return lookups, valid
+
+
+def _old_style_lookups(numpy, codes):
+    """
+    Return ``{field: (table, index)}`` and the validity of ``codes`` decoded
+    as old style, ``table[index]`` being the field of each code.
+    """
+    # Apart from the warranty bit, the fields only depend on the OLD_REV_LUT
+    # entry, so a code per entry and one without any are decoded as a table
+    decoders = [PiDecoder("{:x}".format(code)) for code in range(max(OLD_REV_LUT) + 1)]
+    decoders.append(PiDecoder("ffff"))
+    entry = codes & 0xFFFF
+    entry[entry >= len(decoders)] = len(decoders) - 1
+
+    rows = [decoder.as_dict() for decoder in decoders]
+    lookups = {}
+    for name in FIELDS:
+        table = numpy.full(len(rows), None, dtype=object)
+        table[:] = [row[name] for row in rows]
+        lookups[name] = table, entry
+    lower_bit, bit_size, values = OLD_REV_EXTRA_PROPS["warranty"]
+    lookups["warranty_bit"] = (
+        _field_table(numpy, bit_size, values),
+        _bits(codes, lower_bit, bit_size),
+    )
+    valid = numpy.array([decoder.is_valid_code() for decoder in decoders])
+    return lookups, valid[entry]
+
+
+def _decode_numpy(numpy, rev_codes):
+    if isinstance(rev_codes, numpy.ndarray) and rev_codes.dtype.kind in "iu":
+        codes = rev_codes.astype(numpy.int64).ravel() & 0xFFFFFFFF
+    else:
+        codes = numpy.fromiter(map(_parse_code, rev_codes), dtype=numpy.int64)
+    new_lookups, new_valid = _new_style_lookups(numpy, codes)
+    old_lookups, old_valid = _old_style_lookups(numpy, codes)
+    new_format = _bits(codes, *NEW_REV_STRUCTURE["rev_style"][:2]) == 1
+    results = {
+        "rev_code": codes.astype(numpy.uint32),
+        "valid": numpy.where(new_format, new_valid, old_valid),
+        "new_format": new_format,
+    }
+    for name in FIELDS:
+        # One lookup in the new style table followed by the old style one
+        new_table, new_index = new_lookups[name]
+        old_table, old_index = old_lookups[name]
+        index = numpy.where(new_format, new_index, old_index + len(new_table))
+        results[name] = numpy.concatenate((new_table, old_table))[index]
+    return results
+
+
+def decode_batch(rev_codes, use_numpy=None):
+    """
+    Decode many revision codes at once
+
+    ``rev_codes`` is an iterable of hexadecimal strings or integers, or a
+    NumPy integer array. The result maps ``rev_code``, ``valid``,
+    ``new_format`` and each of :data:`FIELDS` to a column with one value per
+    code, None where :class:`PiDecoder` would raise. With NumPy the columns
+    are arrays decoded with vectorized bit operations and table lookups,
+    otherwise they are lists decoded once per distinct code. ``use_numpy``
+    set to False always returns lists, set to True it requires NumPy.
+    """
+    if use_numpy is None or use_numpy:
+        try:
+            import numpy
+        except ImportError:
+            if use_numpy:
+                raise
+        else:
+            return _decode_numpy(numpy, rev_codes)
+    return _decode_python(rev_codes)
+
+
+# Fields an encoded code must have, the flags default to 0 and revision to 0
+_REQUIRED_FIELDS = ("type", "memory_size", "manufacturer", "processor")
+
+# Bits of a new style code that the board id and the known codes depend on,
+# leaving out the overvoltage, OTP and warranty flags
+_KNOWN_CODE_MASK = 0xFFFFFF
+
+
+def _structure_key(name):
+    return {"warranty_bit": "warranty", "type_raw": "type"}.get(name, name)
+
+
+def _pattern(fields):
+    """
+    Return the ``(mask, code)`` bits a new style code with ``fields`` has,
+    the fields being valued as the :class:`PiDecoder` properties.
+    """
+    mask = code = 0
+    for name, value in fields.items():
+        if name not in FIELDS:
+            raise ValueError(f"Unknown property {name}")
+        lower_bit, bit_size, values = NEW_REV_STRUCTURE[_structure_key(name)]
+        if name == "type_raw" or values is int:
+            raw = value
+        elif isinstance(values, dict):
+            raw = next((raw for raw, text in values.items() if text == value), None)
+        else:
+            raw = values.index(value) if value in values else None
+        if (
+            not isinstance(raw, int)
+            or isinstance(raw, bool)
+            or not 0 <= raw < 1 << bit_size
+            or not PiDecoder._valid_value(  # pylint: disable=protected-access
+                raw, values
+            )
+        ):
+            raise ValueError(f"Invalid value {value!r} for property {name}")
+        mask |= ((1 << bit_size) - 1) << lower_bit
+        code |= raw << lower_bit
+    return mask, code
+
+
+def encode(**fields):
+    """
+    Return the new style revision code, in hexadecimal, with ``fields``
+
+    Fields are named and valued as the :class:`PiDecoder` properties, for
+    example ``encode(type="4B", memory_size="8GB", manufacturer="Sony UK",
+    processor="BCM2711", revision=4)``. ``type``, ``memory_size``,
+    ``manufacturer`` and ``processor`` are required. ``revision`` defaults
+    to 0, the other flags to allowed and intact. The first manufacturer of
+    a name, such as Embest, is used.
+    """
+    for name in _REQUIRED_FIELDS:
+        if name not in fields:
+            raise ValueError(f"Missing property {name}")
+    fields.setdefault("rev_style", NEW_REV_STYLE[1])
+    if fields["rev_style"] != NEW_REV_STYLE[1]:
+        raise ValueError("Only new style revision codes can be encoded")
+    return "{:x}".format(_pattern(fields)[1])
+
+
+def _board_id(type_raw, revision):
+    """Return the board id of a model, as the board detection finds it."""
+    model = boards._PI_MODELS.get(type_raw)  # pylint: disable=protected-access
+    if isinstance(model, dict):
+        model = model.get(revision)
+    return model
+
+
+class RevCodeIndex:
+    """
+    The known revision codes of each board id, and the board id of each code
+
+    Known codes are those of :data:`OLD_REV_LUT` and the new style codes with
+    every field valid and the overvoltage, OTP and warranty flags cleared.
+    Codes with flags set are looked up as if they were cleared. Building the
+    index takes tens of milliseconds and a few megabytes, use
+    :func:`get_index` to share one.
+    """
+
+    def __init__(self):
+        self._board_ids = {}
+        self._old_fields = {}
+        for code in OLD_REV_LUT:
+            decoder = PiDecoder("{:x}".format(code))
+            self._old_fields[code] = decoder.as_dict()
+            self._board_ids[code] = _board_id(decoder.type_raw, decoder.revision)
+        for (
+            memory_size,
+            manufacturer,
+            processor,
+            type_raw,
+            revision,
+        ) in itertools.product(
+            range(len(NEW_MEMORY_SIZE)),
+            range(len(NEW_MANUFACTURER)),
+            range(len(NEW_PROCESSOR)),
+            PI_TYPE,
+            range(16),
+        ):
+            code = (
+                1 << 23
+                | memory_size << 20
+                | manufacturer << 16
+                | processor << 12
+                | type_raw << 4
+                | revision
+            )
+            self._board_ids[code] = _board_id(type_raw, revision)
+        codes = {}
+        for code, board_id in self._board_ids.items():
+            if board_id is not None:
+                codes.setdefault(board_id, []).append(code)
+        self._codes = {board_id: frozenset(found) for board_id, found in codes.items()}
+        self._all_codes = frozenset(itertools.chain.from_iterable(codes.values()))
+
+    @staticmethod
+    def key(rev_code):
+        """Return the known code ``rev_code`` is looked up as."""
+        value = _parse_code(rev_code)
+        if value & 1 << 23:
+            return value & _KNOWN_CODE_MASK
+        return value & 0xFFFF
+
+    def board_id(self, rev_code):
+        """Return the board id of ``rev_code``, None if it has none."""
+        return self._board_ids.get(self.key(rev_code))
+
+    def board_ids(self):
+        """Return every board id that has known codes."""
+        return self._codes.keys()
+
+    def codes(self, board_id=None, **fields):
+        """
+        Return the known codes of ``board_id``, or of every board when None,
+        that have ``fields``, named and valued as the :class:`PiDecoder`
+        properties. For example ``codes(type="4B", memory_size="8GB")``.
+        Codes of models no board id stands for are never returned.
+        """
+        if board_id is None:
+            candidates = self._all_codes
+        else:
+            candidates = self._codes.get(board_id, frozenset())
+        if not fields:
+            return frozenset(candidates)
+        try:
+            mask, pattern = _pattern(fields)
+        except ValueError:
+            # No new style code has these fields, an old style one may
+            if any(name not in FIELDS for name in fields):
+                raise
+            mask, pattern = 1 << 23, 0
+        found = set()
+        for code in candidates:
+            if code & 1 << 23:
+                if code & mask == pattern:
+                    found.add(code)
+            elif all(self._old_fields[code][n] == v for n, v in fields.items()):
+                found.add(code)
+        return frozenset(found)
+
+    def select(self, rev_codes, board_id=None, **fields):
+        """
+        Yield each of ``rev_codes`` whose known code is in
+        ``codes(board_id, **fields)``, checking each one with a set lookup.
+        Codes that are not valid hexadecimal are skipped.
+        """
+        wanted = self.codes(board_id, **fields)
+        for rev_code in rev_codes:
+            try:
+                key = self.key(rev_code)
+            except ValueError:
+                continue
+            if key in wanted:
+                yield rev_code
+
+
+@functools.lru_cache(maxsize=None)
+def get_index():
+    """Return the :class:`RevCodeIndex` shared by every caller."""
+    return RevCodeIndex()
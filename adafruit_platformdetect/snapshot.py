@@ -0,0 +1,251 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_platformdetect.snapshot`
+================================================================================
+
+Capture and replay of everything detection reads
+
+A snapshot records each file the detector read while detecting a host,
+including the ones it found missing, the results of its directory globs and
+listings and the ``BLINKA_*`` environment. Replaying it runs detection again
+anywhere, without the hardware:
+
+.. code-block:: python
+
+    from adafruit_platformdetect.snapshot import Snapshot
+
+    Snapshot.capture().save("pi4.snapshot")  # on the device
+    detector = Snapshot.load("pi4.snapshot").detector()  # anywhere else
+    print(detector.board.id)
+
+The file is gzip compressed JSON and usually only one or two kilobytes. Each
+file carries the SHA-256 of its contents, which is checked on load. USB
+adapters selected with ``BLINKA_FT232H`` and similar settings are replayed
+from the /sys/bus/usb/devices entries that were read. A host captured
+without them replays with no USB adapters.
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Linux and Python 3.7 or Higher
+
+"""
+
+import base64
+import gzip
+import hashlib
+import io
+import json
+import os
+
+try:
+    from typing import Any, Dict, List, Mapping, Optional
+except ImportError:
+    pass
+
+from adafruit_platformdetect import Detector
+from adafruit_platformdetect.chip import __version__
+from adafruit_platformdetect.sysroot import LocalFilesystem, MemoryFilesystem
+
+_FORMAT_VERSION = 1
+
+
+class RecordingFilesystem:
+    """Pass reads through to ``backend`` and remember what they returned."""
+
+    def __init__(self, backend: Any) -> None:
+        self.backend = backend
+        self.live = backend.live
+        # None marks a file that was looked for but not found
+        self.files = {}  # type: Dict[str, Optional[bytes]]
+        self.globs = {}  # type: Dict[str, List[str]]
+
+    def _record(self, path: str, data: Optional[bytes]) -> None:
+        # Keep the longest read when a file is read in pieces of several sizes
+        previous = self.files.get(path)
+        if previous is None or (data is not None and len(data) > len(previous)):
+            self.files[path] = data
+
+    def read_bytes(self, path: str, size: int = -1) -> bytes:
+        """Read ``path`` from the backend and record the result."""
+        try:
+            data = self.backend.read_bytes(path, size)
+        except FileNotFoundError:
+            self._record(path, None)
+            raise
+        self._record(path, data)
+        return data
+
+    def read_text(self, path: str) -> str:
+        """Read ``path`` from the backend and record the result."""
+        try:
+            text = self.backend.read_text(path)
+        except FileNotFoundError:
+            self._record(path, None)
+            raise
+        self._record(path, text.encode("utf-8"))
+        return text
+
+    def exists(self, path: str) -> bool:
+        """Check ``path`` in the backend."""
+        return self.backend.exists(path)
+
+    def glob(self, pattern: str) -> List[str]:
+        """Run ``pattern`` in the backend and record the matches."""
+        matches = self.backend.glob(pattern)
+        self.globs[pattern] = list(matches)
+        return matches
+
+    def listdir(self, path: str) -> List[str]:
+        """List ``path`` in the backend and record it as a glob of its entries."""
+        names = self.backend.listdir(path)
+        directory = path.rstrip("/") + "/"
+        self.globs[directory + "*"] = [directory + name for name in names]
+        return names
+
+
+class SnapshotFilesystem(MemoryFilesystem):
+    """Replay recorded files, answering recorded globs as they were seen."""
+
+    def __init__(
+        self, files: Mapping[str, bytes], globs: Mapping[str, List[str]]
+    ) -> None:
+        super().__init__(files)
+        self.globs = dict(globs)
+
+    def glob(self, pattern: str) -> List[str]:
+        """Return the recorded matches of ``pattern``, if it was recorded."""
+        if pattern in self.globs:
+            return list(self.globs[pattern])
+        return super().glob(pattern)
+
+    def listdir(self, path: str) -> List[str]:
+        """Return the recorded entries of ``path``, if it was listed."""
+        directory = path.rstrip("/") + "/"
+        if directory + "*" in self.globs:
+            return [name[len(directory) :] for name in self.globs[directory + "*"]]
+        return super().listdir(path)
+
+
+class Snapshot:
+    """The files, globs and environment a detection depends on."""
+
+    def __init__(
+        self,
+        files: Mapping[str, Optional[bytes]],
+        globs: Optional[Mapping[str, List[str]]] = None,
+        environ: Optional[Mapping[str, str]] = None,
+        version: Optional[str] = None,
+    ) -> None:
+        self.files = dict(files)
+        self.globs = dict(globs or {})
+        self.environ = dict(environ or {})
+        self.version = version
+
+    def __repr__(self) -> str:
+        return "Snapshot(<{} files, {} globs, {} environment variables>)".format(
+            len(self.files), len(self.globs), len(self.environ)
+        )
+
+    @classmethod
+    def capture(
+        cls, root: Any = None, environ: Optional[Mapping[str, str]] = None
+    ) -> "Snapshot":
+        """Detect the system at ``root``, by default this one, and record it."""
+        if root is None or isinstance(root, str):
+            root = LocalFilesystem(root or "/")
+        if environ is None:
+            environ = os.environ
+        environ = {
+            name: value for name, value in environ.items() if name.startswith("BLINKA_")
+        }
+        recorder = RecordingFilesystem(root)
+        detector = Detector(root=recorder, environ=environ)
+        try:
+            # The board checks that read anything beyond what board.id needs
+            _ = detector.board.id
+            _ = detector.board.any_raspberry_pi
+        except Exception:  # pylint: disable=broad-except
+            # A host detection fails on is the most useful one to capture,
+            # replaying the snapshot raises the same error again
+            pass
+        return cls(recorder.files, recorder.globs, environ, __version__)
+
+    def detector(self) -> Detector:
+        """Return a :class:`Detector` that reads this snapshot."""
+        files = {path: data for path, data in self.files.items() if data is not None}
+        return Detector(
+            root=SnapshotFilesystem(files, self.globs), environ=dict(self.environ)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the snapshot as JSON serializable data."""
+        files = {}  # type: Dict[str, Optional[Dict[str, str]]]
+        for path, data in sorted(self.files.items()):
+            if data is None:
+                files[path] = None
+                continue
+            entry = {"sha256": hashlib.sha256(data).hexdigest()}
+            try:
+                entry["text"] = data.decode("utf-8")
+            except UnicodeDecodeError:
+                entry["base64"] = base64.b64encode(data).decode("ascii")
+            files[path] = entry
+        return {
+            "format": _FORMAT_VERSION,
+            "version": self.version,
+            "environ": self.environ,
+            "files": files,
+            "globs": self.globs,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Snapshot":
+        """Build a snapshot from :meth:`to_dict` output, checking its hashes."""
+        if data.get("format") != _FORMAT_VERSION:
+            raise ValueError(
+                "Unsupported snapshot format {!r}".format(data.get("format"))
+            )
+        files = {}  # type: Dict[str, Optional[bytes]]
+        for path, entry in data["files"].items():
+            if entry is None:
+                files[path] = None
+                continue
+            if "text" in entry:
+                contents = entry["text"].encode("utf-8")
+            else:
+                contents = base64.b64decode(entry["base64"])
+            if hashlib.sha256(contents).hexdigest() != entry["sha256"]:
+                raise ValueError("Snapshot contents of {} are corrupt".format(path))
+            files[path] = contents
+        return cls(files, data["globs"], data["environ"], data.get("version"))
+
+    def dumps(self) -> bytes:
+        """Return the snapshot as compressed bytes."""
+        text = json.dumps(self.to_dict(), separators=(",", ":"), sort_keys=True)
+        buffer = io.BytesIO()
+        # A fixed mtime keeps the output identical for identical snapshots
+        with gzip.GzipFile(fileobj=buffer, mode="wb", mtime=0) as gzip_file:
+            gzip_file.write(text.encode("utf-8"))
+        return buffer.getvalue()
+
+    @classmethod
+    def loads(cls, data: bytes) -> "Snapshot":
+        """Read a snapshot from :meth:`dumps` output."""
+        return cls.from_dict(json.loads(gzip.decompress(data).decode("utf-8")))
+
+    def save(self, path: str) -> None:
+        """Write the snapshot to ``path``."""
+        with open(path, "wb") as snapshot_file:
+            snapshot_file.write(self.dumps())
+
+    @classmethod
+    def load(cls, path: str) -> "Snapshot":
+        """Read a snapshot written by :meth:`save`."""
+        with open(path, "rb") as snapshot_file:
+            return cls.loads(snapshot_file.read())
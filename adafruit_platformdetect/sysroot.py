@@ -0,0 +1,162 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_platformdetect.sysroot`
+================================================================================
+
+Filesystem backends used by :class:`adafruit_platformdetect.Detector`
+
+Every file the detector reads, such as /proc/cpuinfo, the device tree, DMI
+tables and EEPROMs, is read through a backend. By default that is the
+running system, but detection can also run against a copied directory tree
+or an in-memory set of files:
+
+.. code-block:: python
+
+    from adafruit_platformdetect import Detector
+    from adafruit_platformdetect.sysroot import MemoryFilesystem
+
+    detector = Detector(root="/srv/snapshots/pi4")
+    detector = Detector(
+        root=MemoryFilesystem({"/proc/device-tree/compatible": b"brcm,bcm2711\\x00"})
+    )
+
+A backend is any object with ``read_bytes``, ``read_text``, ``exists``,
+``glob`` and ``listdir`` methods and a ``live`` attribute, which is True only
+when it describes the machine Python is running on. Paths are always
+absolute paths as seen by the target system. Missing files raise
+:class:`FileNotFoundError`.
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Linux and Python 3.7 or Higher
+* or MicroPython
+
+"""
+
+import os
+
+try:
+    from typing import Dict, List, Mapping, Optional, Union
+except ImportError:
+    pass
+
+
+class LocalFilesystem:
+    """Files of the running system, or of a copy of one below ``root``."""
+
+    def __init__(self, root: str = "/") -> None:
+        # Stored without the trailing slash so it can be prefixed to paths
+        self.root = root.rstrip("/")
+        self.live = not self.root
+
+    def __repr__(self) -> str:
+        return "LocalFilesystem({!r})".format(self.root or "/")
+
+    def read_bytes(self, path: str, size: int = -1) -> bytes:
+        """Return the contents of ``path``, or its first ``size`` bytes."""
+        with open(self.root + path, "rb") as infile:
+            return infile.read(size)
+
+    def read_text(self, path: str) -> str:
+        """Return the contents of ``path`` decoded as UTF-8."""
+        with open(self.root + path, "r", encoding="utf-8") as infile:
+            return infile.read()
+
+    def exists(self, path: str) -> bool:
+        """Return True if ``path`` is an existing file or directory."""
+        try:
+            os.stat(self.root + path)
+        except OSError:
+            return False
+        return True
+
+    def glob(self, pattern: str) -> List[str]:
+        """Return the paths matching the shell-style ``pattern``."""
+        import glob
+
+        if not self.root:
+            return glob.glob(pattern)
+        prefix = len(self.root)
+        return [path[prefix:] for path in glob.glob(self.root + pattern)]
+
+    def listdir(self, path: str) -> List[str]:
+        """Return the names of the entries of the directory ``path``."""
+        with os.scandir(self.root + path) as entries:
+            return [entry.name for entry in entries]
+
+
+class MemoryFilesystem:
+    """Files held in a dict mapping absolute paths to their contents.
+
+    Directories do not need entries of their own, they exist whenever a file
+    below them does. String contents are stored encoded as UTF-8.
+    """
+
+    live = False
+
+    def __init__(self, files: Mapping[str, Union[bytes, str]]) -> None:
+        self.files = {}  # type: Dict[str, bytes]
+        for path, data in files.items():
+            if isinstance(data, str):
+                data = data.encode("utf-8")
+            self.files[path] = data
+        self._paths = None  # type: Optional[Dict[int, List[str]]]
+
+    def __repr__(self) -> str:
+        return "MemoryFilesystem(<{} files>)".format(len(self.files))
+
+    def read_bytes(self, path: str, size: int = -1) -> bytes:
+        """Return the contents of ``path``, or its first ``size`` bytes."""
+        try:
+            data = self.files[path]
+        except KeyError:
+            raise FileNotFoundError(path) from None
+        return data if size < 0 else data[:size]
+
+    def read_text(self, path: str) -> str:
+        """Return the contents of ``path`` decoded as UTF-8."""
+        return self.read_bytes(path).decode("utf-8")
+
+    def exists(self, path: str) -> bool:
+        """Return True if ``path`` is a file or a directory holding files."""
+        if path in self.files:
+            return True
+        directory = path.rstrip("/") + "/"
+        return any(name.startswith(directory) for name in self.files)
+
+    def glob(self, pattern: str) -> List[str]:
+        """Return the files and directories matching ``pattern``."""
+        from fnmatch import fnmatchcase
+
+        if self._paths is None:
+            # Every file and parent directory, grouped by path depth
+            paths = {}
+            for path in self.files:
+                parts = path.split("/")
+                for depth in range(2, len(parts) + 1):
+                    paths.setdefault(depth, set()).add("/".join(parts[:depth]))
+            self._paths = {depth: sorted(names) for depth, names in paths.items()}
+        parts = pattern.split("/")
+        return [
+            path
+            for path in self._paths.get(len(parts), ())
+            if all(map(fnmatchcase, path.split("/"), parts))
+        ]
+
+    def listdir(self, path: str) -> List[str]:
+        """Return the names of the files and directories right below ``path``."""
+        directory = path.rstrip("/") + "/"
+        names = {
+            name[len(directory) :].split("/", 1)[0]
+            for name in self.files
+            if name.startswith(directory)
+        }
+        if not names:
+            raise FileNotFoundError(path)
+        return sorted(names)
@@ -0,0 +1,137 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_platformdetect.trace`
+================================================================================
+
+Record of the decisions made while detecting
+
+:meth:`adafruit_platformdetect.Detector.explain` runs detection with a
+:class:`Tracer` attached and returns its events in order. Each event names
+the rule evaluated, the input it looked at, what it found and the time it
+took in nanoseconds. Events are:
+
+* ``read``: a file read, glob or directory listing, with the number of
+  bytes, matches or entries
+* ``exists``: a check for a file or directory
+* ``cpuinfo``: a /proc/cpuinfo field lookup
+* ``environ``: a ``BLINKA_*`` setting that decided the chip or board
+* ``dt-compatible``: the device tree compatible rules, with the rule that
+  matched and its position in the priority order
+* ``chip-fallback``: the cpuinfo and compatible checks run when no device
+  tree rule matched
+* ``resolver``: one board resolver of the detected chip, named after its
+  function, or ``constant`` for a board id the chip always maps to
+* ``chip.id`` and ``board.id``: the final results
+
+When no tracer is attached the detection code only checks for one, so
+tracing costs nothing unless it is used.
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Linux and Python 3.7 or Higher
+
+"""
+
+import time
+
+try:
+    from typing import Any, Dict, List
+except ImportError:
+    pass
+
+
+class Tracer:
+    """Ordered list of detection events."""
+
+    def __init__(self) -> None:
+        self.events = []  # type: List[Dict[str, Any]]
+
+    @staticmethod
+    def now() -> int:
+        """Return a timestamp in nanoseconds to pass to :meth:`record`."""
+        return time.perf_counter_ns()
+
+    def record(self, rule: str, source: str, result: Any, start: int) -> None:
+        """Add an event for ``rule`` that started at ``start``."""
+        self.events.append(
+            {
+                "rule": rule,
+                "source": source,
+                "result": result,
+                "elapsed_ns": time.perf_counter_ns() - start,
+            }
+        )
+
+
+class TracingFilesystem:
+    """Pass calls through to ``backend``, adding a ``read`` event for each."""
+
+    def __init__(self, backend: Any, tracer: Tracer) -> None:
+        self.backend = backend
+        self.tracer = tracer
+        self.live = backend.live
+
+    def _read(self, method: Any, path: str, *args: Any) -> Any:
+        start = self.tracer.now()
+        try:
+            data = method(path, *args)
+        except FileNotFoundError:
+            self.tracer.record("read", path, "missing", start)
+            raise
+        self.tracer.record("read", path, "{} bytes".format(len(data)), start)
+        return data
+
+    def read_bytes(self, path: str, size: int = -1) -> bytes:
+        """Read ``path`` from the backend and record it."""
+        return self._read(self.backend.read_bytes, path, size)
+
+    def read_text(self, path: str) -> str:
+        """Read ``path`` from the backend and record it."""
+        return self._read(self.backend.read_text, path)
+
+    def exists(self, path: str) -> bool:
+        """Check ``path`` in the backend and record it."""
+        start = self.tracer.now()
+        found = self.backend.exists(path)
+        self.tracer.record("exists", path, found, start)
+        return found
+
+    def glob(self, pattern: str) -> List[str]:
+        """Run ``pattern`` in the backend and record it."""
+        start = self.tracer.now()
+        matches = self.backend.glob(pattern)
+        self.tracer.record("read", pattern, "{} matches".format(len(matches)), start)
+        return matches
+
+    def listdir(self, path: str) -> List[str]:
+        """List ``path`` in the backend and record it."""
+        start = self.tracer.now()
+        try:
+            names = self.backend.listdir(path)
+        except FileNotFoundError:
+            self.tracer.record("read", path, "missing", start)
+            raise
+        self.tracer.record("read", path, "{} entries".format(len(names)), start)
+        return names
+
+
+def format_events(events: List[Dict[str, Any]]) -> str:
+    """Return ``events`` as a table, one line each."""
+    lines = []
+    for number, event in enumerate(events, 1):
+        lines.append(
+            "{:3d} {:>10.1f} us  {:<14} {:<44} {}".format(
+                number,
+                event["elapsed_ns"] / 1000,
+                event["rule"],
+                event["source"],
+                event["result"],
+            )
+        )
+    return "\n".join(lines)
@@ -0,0 +1,200 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_platformdetect.usbdevices`
+================================================================================
+
+USB bridges attached to the host, enumerated once per detection
+
+The ``BLINKA_*`` settings for USB bridges find their device by vendor and
+product id. :data:`USB_IDS` is the one table of those ids, with the chip and
+board each one is, and :class:`UsbDevices` looks them up the first time they
+are needed and indexes them by ``(vendor id, product id)``. The chip and the
+board detection share the result through
+:meth:`adafruit_platformdetect.Detector.get_usb_devices`.
+
+On Linux the ids are read from the ``idVendor`` and ``idProduct`` files of
+/sys/bus/usb/devices, listed once through the detector's sysroot, so no USB
+library is imported and a fake sysfs tree can stand in for the hardware.
+Only when the running system has no such directory are the HID devices
+enumerated with hidapi, every FTDI variant scanned for at once with pyftdi,
+or the bus searched with pyusb. Any other sysroot without one has no USB
+devices.
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Linux and Python 3.7 or Higher
+* hidapi, for HID devices without sysfs
+* pyftdi, for FTDI devices without sysfs
+* pyusb, for other devices without sysfs
+
+"""
+
+try:
+    from typing import Any, Dict, List, Optional, Tuple
+except ImportError:
+    pass
+
+from adafruit_platformdetect.constants import boards, chips
+
+# Chip and board id of each USB bridge, by (vendor id, product id)
+USB_IDS = {
+    (0x0403, 0x6014): (chips.FT232H, boards.FTDI_FT232H),
+    (0x0403, 0x6010): (chips.FT2232H, boards.FTDI_FT2232H),
+    (0x0403, 0x6011): (chips.FT4232H, boards.FTDI_FT4232H),
+    (0x04D8, 0x00DD): (chips.MCP2221, boards.MICROCHIP_MCP2221),
+    (0x1D50, 0x60E6): (chips.LPC4330, boards.GREATFET_ONE),
+    # Raspberry Pi Pico
+    (0xCAFE, 0x4005): (chips.RP2040_U2IF, boards.PICO_U2IF),
+    # Radxa X4
+    (0xCAFF, 0x4005): (chips.RP2040_U2IF, boards.RADXA_X4_U2IF),
+    # Feather RP2040
+    (0x239A, 0x00F1): (chips.RP2040_U2IF, boards.FEATHER_U2IF),
+    # Itsy Bitsy RP2040
+    (0x239A, 0x00FD): (chips.RP2040_U2IF, boards.ITSYBITSY_U2IF),
+    # QT Py RP2040
+    (0x239A, 0x00F7): (chips.RP2040_U2IF, boards.QTPY_U2IF),
+    # QT2040 Trinkey
+    (0x239A, 0x0109): (chips.RP2040_U2IF, boards.QT2040_TRINKEY_U2IF),
+    # MacroPad RP2040
+    (0x239A, 0x0107): (chips.RP2040_U2IF, boards.MACROPAD_U2IF),
+    # Feather RP2040 ThinkInk
+    (0x239A, 0x812C): (chips.RP2040_U2IF, boards.FEATHER_EPD_U2IF),
+    # Feather RP2040 RFM
+    (0x239A, 0x812E): (chips.RP2040_U2IF, boards.FEATHER_RFM_U2IF),
+    # Feather RP2040 CAN Bus
+    (0x239A, 0x8130): (chips.RP2040_U2IF, boards.FEATHER_CAN_U2IF),
+    # KB2040 Kee Board
+    (0x239A, 0x0105): (chips.RP2040_U2IF, boards.KB2040_U2IF),
+    # Waveshare RP2040 One
+    (0x2E8A, 0x103A): (chips.RP2040_U2IF, boards.RP2040_ONE_U2IF),
+}
+
+FTDI_VENDOR_ID = 0x0403
+
+_FTDI_IDS = tuple(key for key in USB_IDS if key[0] == FTDI_VENDOR_ID)
+
+SYSFS_USB_DEVICES = "/sys/bus/usb/devices"
+
+_UNSET = object()
+
+
+class UsbDevices:
+    """USB devices by ``(vendor id, product id)``, enumerated on first use.
+
+    ``sysroot`` is the filesystem backend /sys/bus/usb/devices is read from.
+    """
+
+    def __init__(self, sysroot: Any) -> None:
+        self.sysroot = sysroot
+        self._sysfs = _UNSET  # type: Any
+        self._hid = None  # type: Optional[Dict[Tuple[int, int], List[Any]]]
+        self._ftdi = None  # type: Optional[Dict[Tuple[int, int], List[Any]]]
+
+    def sysfs(self) -> Optional[Dict[Tuple[int, int], List[str]]]:
+        """
+        Return the names of the devices in /sys/bus/usb/devices by
+        ``(vendor id, product id)``, in name order. It is only listed once.
+        When the directory cannot be listed, for example when it is missing
+        or access to it is denied, that is None on the running system, so
+        the USB libraries are used instead, and no devices on any other.
+        """
+        if self._sysfs is _UNSET:
+            try:
+                names = self.sysroot.listdir(SYSFS_USB_DEVICES)
+            except OSError:
+                self._sysfs = None if self.sysroot.live else {}
+                return self._sysfs
+            devices = {}  # type: Dict[Tuple[int, int], List[str]]
+            for name in sorted(names):
+                if ":" in name:
+                    # An interface of a device, which has no ids of its own
+                    continue
+                path = SYSFS_USB_DEVICES + "/" + name + "/"
+                try:
+                    vendor_id = int(self.sysroot.read_text(path + "idVendor"), 16)
+                    product_id = int(self.sysroot.read_text(path + "idProduct"), 16)
+                except (OSError, ValueError):
+                    continue
+                devices.setdefault((vendor_id, product_id), []).append(name)
+            self._sysfs = devices
+        return self._sysfs
+
+    def hid(self) -> Dict[Tuple[int, int], List[Any]]:
+        """
+        Return the HID devices by ``(vendor id, product id)``, in the order
+        they were enumerated. :func:`hid.enumerate` is only called once.
+        """
+        if self._hid is None:
+            import hid
+
+            devices = {}  # type: Dict[Tuple[int, int], List[Any]]
+            for device in hid.enumerate():
+                key = (device["vendor_id"], device["product_id"])
+                devices.setdefault(key, []).append(device)
+            self._hid = devices
+        return self._hid
+
+    def ftdi(self) -> Dict[Tuple[int, int], List[Any]]:
+        """
+        Return the FTDI devices by ``(vendor id, product id)``, found by a
+        single :meth:`pyftdi.usbtools.UsbTools.find_all` call for every FTDI
+        variant of :data:`USB_IDS`.
+        """
+        if self._ftdi is None:
+            from pyftdi.usbtools import UsbTools
+
+            devices = {}  # type: Dict[Tuple[int, int], List[Any]]
+            for descriptor, _ in UsbTools.find_all(_FTDI_IDS):
+                key = (descriptor.vid, descriptor.pid)
+                devices.setdefault(key, []).append(descriptor)
+            self._ftdi = devices
+        return self._ftdi
+
+    @staticmethod
+    def _match(devices: Dict[Tuple[int, int], List[Any]], chip_id: str) -> List:
+        return [key for key in devices if key in USB_IDS and USB_IDS[key][0] == chip_id]
+
+    def _find(self, fallback: Any, chip_id: str) -> List[Tuple[int, int]]:
+        devices = self.sysfs()
+        if devices is None:
+            devices = fallback()
+        return self._match(devices, chip_id)
+
+    def find_hid(self, chip_id: str) -> List[Tuple[int, int]]:
+        """
+        Return the ``(vendor id, product id)`` of each HID device with the
+        chip ``chip_id``, in sysfs name order or else the order
+        :meth:`hid` enumerated them.
+        """
+        return self._find(self.hid, chip_id)
+
+    def find_ftdi(self, chip_id: str) -> List[Tuple[int, int]]:
+        """
+        Return the ``(vendor id, product id)`` of each FTDI device with the
+        chip ``chip_id``, in no particular order.
+        """
+        return self._find(self.ftdi, chip_id)
+
+    def find_usb(self, chip_id: str) -> List[Tuple[int, int]]:
+        """
+        Return the ``(vendor id, product id)`` of each USB device with the
+        chip ``chip_id``. Without sysfs each of its ids is looked for with
+        :func:`usb.core.find`.
+        """
+        devices = self.sysfs()
+        if devices is not None:
+            return self._match(devices, chip_id)
+        import usb.core
+
+        return [
+            key
+            for key, (chip, _) in USB_IDS.items()
+            if chip == chip_id
+            and usb.core.find(idVendor=key[0], idProduct=key[1]) is not None
+        ]
@@ -0,0 +1,208 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`benchmarks.corpus`
+================================================================================
+
+Synthetic detection inputs for the benchmarks
+
+Each case is a set of system files and ``BLINKA_*`` settings. Together the
+cases reach every device tree rule and fallback branch of
+``Chip._linux_id`` and every chip that has board resolvers in
+``Board._CHIP_RESOLVERS``. Chips that cannot be reached from files alone,
+such as microcontrollers and USB adapters, are reached with
+``BLINKA_FORCECHIP``.
+
+"""
+
+try:
+    from typing import Dict, Optional, Tuple, Union
+except ImportError:
+    pass
+
+from adafruit_platformdetect import Detector
+from adafruit_platformdetect.board import Board
+from adafruit_platformdetect.chip import _DT_COMPATIBLE_CHIPS
+from adafruit_platformdetect.sysroot import MemoryFilesystem
+
+CPUINFO_ARM = "processor\t: 0\nmodel name\t: ARMv7 Processor rev 3 (v7l)\n"
+
+CPUINFO_X86_CORE = (
+    "processor\t: {index}\n"
+    "vendor_id\t: {vendor}\n"
+    "cpu family\t: 6\n"
+    "model\t\t: 85\n"
+    "model name\t: {model}\n"
+    "stepping\t: 7\n"
+    "cpu MHz\t\t: 2500.000\n"
+    "cache size\t: 36608 KB\n"
+    "physical id\t: 0\n"
+    "siblings\t: {count}\n"
+    "core id\t\t: {index}\n"
+    "cpu cores\t: {count}\n"
+    "flags\t\t: fpu vme de pse tsc msr pae mce cx8 apic sep mtrr pge mca cmov"
+    " pat pse36 clflush mmx fxsr sse sse2 ss ht syscall nx pdpe1gb rdtscp lm"
+    " constant_tsc rep_good nopl xtopology nonstop_tsc cpuid tsc_known_freq pni"
+    " pclmulqdq ssse3 fma cx16 pcid sse4_1 sse4_2 x2apic movbe popcnt aes xsave"
+    " avx f16c rdrand hypervisor lahf_lm abm 3dnowprefetch invpcid_single ssbd"
+    " ibrs ibpb stibp ibrs_enhanced fsgsbase tsc_adjust bmi1 avx2 smep bmi2 erms"
+    " invpcid avx512f avx512dq rdseed adx smap clflushopt clwb avx512cd"
+    " avx512bw avx512vl xsaveopt xsavec xgetbv1 xsaves arat avx512_vnni\n"
+    "bogomips\t: 5000.00\n"
+    "address sizes\t: 46 bits physical, 48 bits virtual\n"
+    "\n"
+)
+
+
+def x86_cpuinfo(vendor: str, model: str, count: int = 1) -> str:
+    """Return /proc/cpuinfo text of an x86 host with ``count`` processors."""
+    return "".join(
+        CPUINFO_X86_CORE.format(index=index, vendor=vendor, model=model, count=count)
+        for index in range(count)
+    )
+
+
+def arm_cpuinfo(hardware: Optional[str] = None, revision: Optional[str] = None) -> str:
+    """Return /proc/cpuinfo text of an ARM host."""
+    text = CPUINFO_ARM
+    if hardware is not None:
+        text += "Hardware\t: {}\n".format(hardware)
+    if revision is not None:
+        text += "Revision\t: {}\n".format(revision)
+    return text
+
+
+def _compatible(*entries: str) -> bytes:
+    return "".join(entry + "\x00" for entry in entries).encode("utf-8")
+
+
+# The branches of Chip._linux_id after the device tree rules
+_FALLBACK_CASES = {
+    "x86-amd": {"/proc/cpuinfo": x86_cpuinfo("AuthenticAMD", "AMD EPYC 7R13")},
+    "x86-amd-v1605b": {
+        "/proc/cpuinfo": x86_cpuinfo("AuthenticAMD", "AMD Ryzen Embedded V1605B")
+    },
+    "x86-intel": {"/proc/cpuinfo": x86_cpuinfo("GenuineIntel", "Intel Xeon")},
+    "x86-intel-n3710": {
+        "/proc/cpuinfo": x86_cpuinfo("GenuineIntel", "Intel Pentium N3710")
+    },
+    "x86-intel-n5105": {
+        "/proc/cpuinfo": x86_cpuinfo("GenuineIntel", "Intel Celeron N5105")
+    },
+    "x86-intel-x5-z8350": {
+        "/proc/cpuinfo": x86_cpuinfo("GenuineIntel", "Intel Atom x5-Z8350")
+    },
+    "x86-intel-j4105": {
+        "/proc/cpuinfo": x86_cpuinfo("GenuineIntel", "Intel Celeron J4105"),
+        "/sys/devices/virtual/dmi/id/board_name": "ODYSSEY-X86J41X5\n",
+    },
+    "mips-24kc": {
+        "/proc/cpuinfo": "system type\t: MT7628\ncpu model\t: MIPS 24Kc V5.5\n"
+    },
+    "mips-24kec": {
+        "/proc/cpuinfo": "system type\t: MT7621\ncpu model\t: MIPS 24KEc V4.12\n"
+    },
+    "hardware-am33xx": {
+        "/proc/cpuinfo": arm_cpuinfo("Generic AM33XX (Flattened Device Tree)")
+    },
+    "hardware-bcm2711": {
+        "/proc/cpuinfo": arm_cpuinfo("BCM2711", "c03114"),
+        "/proc/device-tree/model": "Raspberry Pi 4 Model B Rev 1.4\x00",
+    },
+    "hardware-bcm2835-old-pi": {
+        "/proc/cpuinfo": arm_cpuinfo("BCM2835", "000e"),
+        "/proc/device-tree/model": "Raspberry Pi Model B Rev 2\x00",
+    },
+    "hardware-bcm2835-model-only": {
+        "/proc/cpuinfo": arm_cpuinfo("BCM2835"),
+        "/proc/device-tree/model": "Raspberry Pi 3 Model B Plus Rev 1.3\x00",
+    },
+}
+
+for _tegra in ("210", "186", "194", "234", "264"):
+    _FALLBACK_CASES["tegra" + _tegra] = {
+        "/proc/cpuinfo": arm_cpuinfo(),
+        "/proc/device-tree/compatible": _compatible(
+            "nvidia,p3450-0000", "nvidia,tegra" + _tegra
+        ),
+        "/proc/device-tree/model": "NVIDIA Jetson\x00",
+    }
+
+for _name, _entries in {
+    "imx8m": ("fsl,imx8mq-evk", "fsl,imx8mq"),
+    "odroid-c2": ("hardkernel,odroid-c2", "amlogic,meson-gxbb"),
+    "amlogic-g12a": ("hardkernel,odroid-c4", "amlogic, g12a"),
+    "amlogic-g12b": ("hardkernel,odroid-n2", "amlogic,g12b"),
+    "amlogic-sm1": ("radxa,zero", "amlogic,sm1"),
+    "amlogic-vim3": ("khadas,vim3 amlogic",),
+    "sun50i-a64": ("pine64,pine64-plus", "allwinner,sun50i-a64"),
+    "sun50i-h6": ("pine64,pine-h64", "allwinner,sun50i-h6"),
+    "sun50i-h5": ("friendlyarm,nanopi-neo2", "allwinner,sun50i-h5"),
+    "cvitek-cv180x": ("milkv,duo", "cvitek,cv180x"),
+    "zynqmp": ("xlnx,zynqmp-zcu104", "xlnx,zynqmp"),
+}.items():
+    _FALLBACK_CASES["compatible-" + _name] = {
+        "/proc/cpuinfo": arm_cpuinfo(),
+        "/proc/device-tree/compatible": _compatible(*_entries),
+        "/proc/device-tree/model": _entries[0] + "\x00",
+    }
+
+for _hardware in (
+    "DRA74X",
+    "sun4i",
+    "sun7i",
+    "sun8i",
+    "ODROIDC",
+    "ODROID-C2",
+    "ODROID-N2",
+    "ODROID-C4",
+    "ODROID-XU4",
+    "KHADAS-VIM3",
+    "SAMA5",
+    "Pinebook",
+    "ASUS_TINKER_BOARD",
+):
+    _FALLBACK_CASES["hardware-" + _hardware.lower()] = {
+        "/proc/cpuinfo": arm_cpuinfo(_hardware),
+        "/proc/device-tree/model": "Benchmark Board\x00",
+    }
+
+_FALLBACK_CASES["hardware-xilinx-zynq"] = {
+    "/proc/cpuinfo": arm_cpuinfo("Xilinx Zynq Platform"),
+    "/proc/device-tree/compatible": _compatible("xlnx,zynq-7000"),
+}
+
+# Worst case for the fallback path: no device tree and a large x86 host
+WORST_CASE = "x86-intel-256-cores"
+_FALLBACK_CASES[WORST_CASE] = {
+    "/proc/cpuinfo": x86_cpuinfo("GenuineIntel", "Intel Xeon Platinum 8375C", 256)
+}
+
+
+def build_corpus() -> Dict[str, Tuple[Dict[str, Union[bytes, str]], Dict[str, str]]]:
+    """Return ``{name: (files, environ)}`` for every benchmark case."""
+    corpus = {}
+    for pattern, _ in _DT_COMPATIBLE_CHIPS:
+        files = {
+            "/proc/cpuinfo": arm_cpuinfo(),
+            "/proc/device-tree/compatible": _compatible("vendor,board", pattern),
+            "/proc/device-tree/model": "Benchmark Board\x00",
+        }
+        corpus.setdefault("dt-" + pattern, (files, {}))
+    for name, files in _FALLBACK_CASES.items():
+        corpus[name] = (files, {})
+
+    # Reach the remaining resolver chains with a forced chip id
+    detected = set()
+    for files, environ in corpus.values():
+        detector = Detector(root=MemoryFilesystem(files), environ=environ)
+        detected.add(detector.chip.id)
+    for chip_id in Board._CHIP_RESOLVERS:  # pylint: disable=protected-access
+        if chip_id not in detected:
+            corpus["forced-" + chip_id] = (
+                {"/proc/cpuinfo": arm_cpuinfo()},
+                {"BLINKA_FORCECHIP": chip_id},
+            )
+    return corpus
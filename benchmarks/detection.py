@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`benchmarks.detection`
+================================================================================
+
+Time cold and warm detection for every case of the benchmark corpus
+
+For each case this measures, in nanoseconds:
+
+* ``construct``: ``Detector()`` construction
+* ``chip_id``: the first ``chip.id`` of a new detector
+* ``board_id``: the first ``board.id`` of a new detector, chip included
+* ``warm_access``: one ``chip.id`` plus ``board.id`` once detection is done
+* ``any_properties``: every ``board.any_*`` property once after detection
+
+The minimum and median of each are written as JSON. Given a previous result
+with ``--compare``, minimums that got slower by more than ``--threshold``
+are listed and the exit status is 1. The minimum is compared as it is the
+least affected by other load on the machine.
+
+Run from the repository root::
+
+    PYTHONPATH=. python benchmarks/detection.py -o results.json
+    PYTHONPATH=. python benchmarks/detection.py --compare results.json
+
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+
+from corpus import WORST_CASE, build_corpus
+
+from adafruit_platformdetect import Detector
+from adafruit_platformdetect.board import Board
+from adafruit_platformdetect.chip import __version__
+from adafruit_platformdetect.sysroot import MemoryFilesystem
+
+ANY_PROPERTIES = tuple(
+    name
+    for name in sorted(dir(Board))
+    if name.startswith("any_") and isinstance(getattr(Board, name), property)
+)
+
+WARM_LOOPS = 100
+
+
+def _any_properties(detector):
+    for name in ANY_PROPERTIES:
+        getattr(detector.board, name)
+
+
+def measure_case(files, environ, repeat):
+    """Return ``{metric: [nanoseconds, ...]}`` for one corpus case."""
+    samples = {
+        "construct": [],
+        "chip_id": [],
+        "board_id": [],
+        "warm_access": [],
+        "any_properties": [],
+    }
+    clock = time.perf_counter_ns
+    for _ in range(repeat):
+        # A new backend each time, so no state carries over between runs
+        root = MemoryFilesystem(files)
+        start = clock()
+        detector = Detector(root=root, environ=environ)
+        samples["construct"].append(clock() - start)
+
+        start = clock()
+        _ = detector.chip.id
+        samples["chip_id"].append(clock() - start)
+
+        detector = Detector(root=MemoryFilesystem(files), environ=environ)
+        start = clock()
+        _ = detector.board.id
+        samples["board_id"].append(clock() - start)
+
+        start = clock()
+        for _ in range(WARM_LOOPS):
+            _ = detector.chip.id
+            _ = detector.board.id
+        samples["warm_access"].append((clock() - start) // WARM_LOOPS)
+
+        start = clock()
+        _any_properties(detector)
+        samples["any_properties"].append(clock() - start)
+    return samples
+
+
+def run(repeat, only=None):
+    """Benchmark the corpus and return the results as JSON-ready data."""
+    cases = {}
+    for name, (files, environ) in sorted(build_corpus().items()):
+        if only and only not in name:
+            continue
+        try:
+            # Untimed run, which also skips cases needing missing hardware
+            # libraries such as hid
+            detector = Detector(root=MemoryFilesystem(files), environ=environ)
+            _ = detector.board.id
+            _any_properties(detector)
+        except Exception as error:  # pylint: disable=broad-except
+            cases[name] = {"error": "{}: {}".format(type(error).__name__, error)}
+            continue
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            samples = measure_case(files, environ, repeat)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        cases[name] = {
+            "chip_id": detector.chip.id,
+            "board_id": detector.board.id,
+            "timings": {
+                metric: {"min": min(values), "median": statistics.median(values)}
+                for metric, values in samples.items()
+            },
+        }
+
+    timed = [case["timings"] for case in cases.values() if "timings" in case]
+    summary = {}
+    if timed:
+        for metric in timed[0]:
+            medians = [timings[metric]["median"] for timings in timed]
+            summary[metric] = {
+                "total_median": sum(medians),
+                "max_median": max(medians),
+            }
+    return {
+        "meta": {
+            "version": __version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "repeat": repeat,
+            "worst_case": WORST_CASE,
+        },
+        "summary": summary,
+        "cases": cases,
+    }
+
+
+def compare(baseline, current, threshold):
+    """Return a line for each minimum slower than ``threshold`` times before."""
+    slower = []
+    for name, case in sorted(current["cases"].items()):
+        old_case = baseline["cases"].get(name, {})
+        for metric, values in case.get("timings", {}).items():
+            old = old_case.get("timings", {}).get(metric)
+            if old and values["min"] > old["min"] * threshold:
+                slower.append(
+                    "{} {}: {} ns -> {} ns".format(
+                        name, metric, old["min"], values["min"]
+                    )
+                )
+    return slower
+
+
+def main():
+    """Run the program"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("-o", "--output", help="write JSON here instead of stdout")
+    parser.add_argument("-r", "--repeat", type=int, default=25, help="runs per case")
+    parser.add_argument("-k", "--only", help="only cases with this in their name")
+    parser.add_argument("--compare", help="earlier JSON result to compare with")
+    parser.add_argument(
+        "--threshold", type=float, default=1.25, help="slowdown ratio to report"
+    )
+    args = parser.parse_args()
+
+    results = run(args.repeat, args.only)
+    text = json.dumps(results, indent=1, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            output.write(text + "\n")
+    elif not args.compare:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as baseline_file:
+            slower = compare(json.load(baseline_file), results, args.threshold)
+        for line in slower:
+            print(line)
+        return 1 if slower else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
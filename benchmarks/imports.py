@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`benchmarks.imports`
+================================================================================
+
+Time and size the import of the package
+
+Each run imports the package in a new interpreter with ``-X importtime``
+and, in another one, under :mod:`tracemalloc`. For every module the package
+imports this records the minimum and median of its own and its cumulative
+import time in microseconds, and for the whole import the memory allocated
+in bytes. The package is compiled first, so the times are those of loading
+cached bytecode.
+
+Given a previous result with ``--compare``, times that got slower by more
+than ``--threshold`` are listed and the exit status is 1. The same happens
+when the fastest import takes longer than ``--budget`` microseconds, or
+when it loads a module given with ``--forbid``. CI enforces a budget of its
+own with tests/test_imports.py.
+
+Run from the repository root::
+
+    PYTHONPATH=. python benchmarks/imports.py -o imports.json
+    PYTHONPATH=. python benchmarks/imports.py --compare imports.json
+    PYTHONPATH=. python benchmarks/imports.py --budget 30000 --forbid glob
+
+"""
+
+import argparse
+import compileall
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+
+try:
+    from typing import Dict, List, Optional, Tuple
+except ImportError:
+    pass
+
+PACKAGE = "adafruit_platformdetect"
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_MEMORY_SCRIPT = (
+    "import sys, tracemalloc\n"
+    "before = set(sys.modules)\n"
+    "tracemalloc.start()\n"
+    "import {module}\n"
+    "current, peak = tracemalloc.get_traced_memory()\n"
+    "print(current, peak, *sorted(set(sys.modules) - before))\n"
+)
+
+
+def _python(args: List[str]) -> subprocess.CompletedProcess:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        path for path in (ROOT, env.get("PYTHONPATH")) if path
+    )
+    return subprocess.run(
+        [sys.executable] + args,
+        env=env,
+        check=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+
+
+def import_times(module: str) -> Dict[str, Tuple[int, int]]:
+    """Return ``{module: (self us, cumulative us)}`` for one import."""
+    stderr = _python(["-X", "importtime", "-c", "import " + module]).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def import_memory(module: str) -> Tuple[int, int, List[str]]:
+    """
+    Return the bytes allocated, the peak allocation and the names of the
+    modules loaded by one import.
+    """
+    stdout = _python(["-c", _MEMORY_SCRIPT.format(module=module)]).stdout
+    current, peak, *loaded = stdout.split()
+    return int(current), int(peak), loaded
+
+
+def _stats(values: List[int]) -> Dict[str, float]:
+    return {"min": min(values), "median": statistics.median(values)}
+
+
+def run(repeat: int, module: str = PACKAGE) -> dict:
+    """Import ``module`` ``repeat`` times and return the JSON-ready results."""
+    compileall.compile_dir(os.path.join(ROOT, PACKAGE), quiet=1)
+    samples = {}  # type: Dict[str, Dict[str, List[int]]]
+    memory = {"current": [], "peak": []}  # type: Dict[str, List[int]]
+    loaded = []  # type: List[str]
+    for _ in range(repeat):
+        for name, (self_us, cumulative_us) in import_times(module).items():
+            sample = samples.setdefault(name, {"self": [], "cumulative": []})
+            sample["self"].append(self_us)
+            sample["cumulative"].append(cumulative_us)
+        current, peak, loaded = import_memory(module)
+        memory["current"].append(current)
+        memory["peak"].append(peak)
+
+    return {
+        "meta": {
+            "module": module,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "repeat": repeat,
+        },
+        "total": _stats(samples[module]["cumulative"]),
+        "memory": {name: _stats(values) for name, values in memory.items()},
+        "loaded": loaded,
+        "modules": {
+            name: {metric: _stats(values) for metric, values in sample.items()}
+            for name, sample in samples.items()
+            # Modules imported only some of the time, such as those of site
+            # packages, are not comparable
+            if len(sample["self"]) == repeat
+        },
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> List[str]:
+    """Return a line for each minimum slower than ``threshold`` times before."""
+    slower = []
+    old, new = baseline["total"]["min"], current["total"]["min"]
+    if new > old * threshold:
+        slower.append("total: {} us -> {} us".format(old, new))
+    for name, times in sorted(current["modules"].items()):
+        old_times = baseline["modules"].get(name)
+        if not name.startswith(PACKAGE) or not old_times:
+            continue
+        old, new = old_times["self"]["min"], times["self"]["min"]
+        if new > old * threshold:
+            slower.append("{}: {} us -> {} us".format(name, old, new))
+    return slower
+
+
+def check_budget(
+    results: dict, budget: Optional[int], forbidden: List[str]
+) -> List[str]:
+    """Return a line for each way ``results`` goes over the budget."""
+    problems = []
+    if budget is not None and results["total"]["min"] > budget:
+        problems.append(
+            "total: {} us over the budget of {} us".format(
+                results["total"]["min"], budget
+            )
+        )
+    for name in forbidden:
+        if name in results["loaded"]:
+            problems.append("{} is loaded by the import".format(name))
+    return problems
+
+
+def main() -> int:
+    """Run the program"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("-o", "--output", help="write JSON here instead of stdout")
+    parser.add_argument("-r", "--repeat", type=int, default=20, help="imports")
+    parser.add_argument("-m", "--module", default=PACKAGE, help="module to import")
+    parser.add_argument("--compare", help="earlier JSON result to compare with")
+    parser.add_argument(
+        "--threshold", type=float, default=1.25, help="slowdown ratio to report"
+    )
+    parser.add_argument("--budget", type=int, help="most microseconds to allow")
+    parser.add_argument(
+        "--forbid",
+        action="append",
+        default=[],
+        metavar="MODULE",
+        help="module the import must not load, may be repeated",
+    )
+    args = parser.parse_args()
+
+    results = run(args.repeat, args.module)
+    text = json.dumps(results, indent=1, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            output.write(text + "\n")
+    elif not (args.compare or args.budget or args.forbid):
+        print(text)
+
+    problems = check_budget(results, args.budget, args.forbid)
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as baseline_file:
+            problems += compare(json.load(baseline_file), results, args.threshold)
+    for line in problems:
+        print(line)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
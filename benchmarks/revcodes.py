@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`benchmarks.revcodes`
+================================================================================
+
+Time decoding a list of Raspberry Pi revision codes every way the library can
+
+The codes are drawn at random from ``--distinct`` revision codes, valid or
+not, the way a fleet reports a few hundred models many times over. Each
+method decodes every field of every code:
+
+* ``scalar``: a new ``PiDecoder`` per code
+* ``scalar_cached``: ``get_decoder()`` per code
+* ``batch_python``: ``decode_batch()`` without NumPy
+* ``batch_numpy``: ``decode_batch()`` of the hexadecimal strings
+* ``batch_numpy_array``: ``decode_batch()`` of an integer array
+
+The minimum and median time of each, in nanoseconds, are written as JSON
+along with the time per code. The NumPy methods are left out when it is not
+installed. Given a previous result with ``--compare``, minimums that got
+slower by more than ``--threshold`` are listed and the exit status is 1.
+
+Run from the repository root::
+
+    PYTHONPATH=. python benchmarks/revcodes.py -o revcodes.json
+    PYTHONPATH=. python benchmarks/revcodes.py --compare revcodes.json
+
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+
+from adafruit_platformdetect.revcodes import (
+    NEW_MANUFACTURER,
+    NEW_MEMORY_SIZE,
+    NEW_PROCESSOR,
+    OLD_REV_LUT,
+    PI_TYPE,
+    PiDecoder,
+    decode_batch,
+    get_decoder,
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def build_codes(count, distinct, seed):
+    """Return ``count`` hexadecimal codes drawn from ``distinct`` ones."""
+    rng = random.Random(seed)
+    pool = ["{:x}".format(code) for code in OLD_REV_LUT]
+    while len(pool) < distinct:
+        # New style codes, valid but for one in ten with random bits
+        code = (
+            rng.randrange(len(NEW_MEMORY_SIZE)) << 20
+            | rng.randrange(len(NEW_MANUFACTURER)) << 16
+            | rng.randrange(len(NEW_PROCESSOR)) << 12
+            | rng.choice(list(PI_TYPE)) << 4
+            | rng.randrange(16)
+        )
+        if rng.random() < 0.1:
+            code = rng.getrandbits(32)
+        pool.append("{:x}".format(code | 1 << 23))
+    pool = pool[:distinct]
+    return [rng.choice(pool) for _ in range(count)]
+
+
+def _scalar(codes):
+    for code in codes:
+        decoder = PiDecoder(code)
+        decoder.is_valid_code()
+        decoder.as_dict()
+
+
+def _scalar_cached(codes):
+    get_decoder.cache_clear()
+    for code in codes:
+        decoder = get_decoder(code)
+        decoder.is_valid_code()
+        decoder.as_dict()
+
+
+def methods(codes):
+    """Return ``{name: callable}`` of the methods that can run here."""
+    found = {
+        "scalar": lambda: _scalar(codes),
+        "scalar_cached": lambda: _scalar_cached(codes),
+        "batch_python": lambda: decode_batch(codes, use_numpy=False),
+    }
+    if numpy is not None:
+        array = numpy.array([int(code, 16) for code in codes], dtype=numpy.uint32)
+        found["batch_numpy"] = lambda: decode_batch(codes, use_numpy=True)
+        found["batch_numpy_array"] = lambda: decode_batch(array, use_numpy=True)
+    return found
+
+
+def run(count, distinct, repeat, seed=0):
+    """Time every method and return the results as JSON-ready data."""
+    codes = build_codes(count, distinct, seed)
+    timings = {}
+    for name, method in methods(codes).items():
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter_ns()
+            method()
+            samples.append(time.perf_counter_ns() - start)
+        timings[name] = {
+            "min": min(samples),
+            "median": statistics.median(samples),
+            "per_code": min(samples) / count,
+        }
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "numpy": numpy.__version__ if numpy is not None else None,
+            "count": count,
+            "distinct": distinct,
+            "repeat": repeat,
+        },
+        "timings": timings,
+    }
+
+
+def compare(baseline, current, threshold):
+    """Return a line for each minimum slower than ``threshold`` times before."""
+    slower = []
+    for name, values in sorted(current["timings"].items()):
+        old = baseline["timings"].get(name)
+        if old and values["min"] > old["min"] * threshold:
+            slower.append("{}: {} ns -> {} ns".format(name, old["min"], values["min"]))
+    return slower
+
+
+def main():
+    """Run the program"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("-o", "--output", help="write JSON here instead of stdout")
+    parser.add_argument("-n", "--count", type=int, default=100000, help="codes")
+    parser.add_argument(
+        "-d", "--distinct", type=int, default=200, help="distinct codes"
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="runs per method")
+    parser.add_argument("--compare", help="earlier JSON result to compare with")
+    parser.add_argument(
+        "--threshold", type=float, default=1.25, help="slowdown ratio to report"
+    )
+    args = parser.parse_args()
+
+    results = run(args.count, args.distinct, args.repeat)
+    text = json.dumps(results, indent=1, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            output.write(text + "\n")
+    elif not args.compare:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as baseline_file:
+            slower = compare(json.load(baseline_file), results, args.threshold)
+        for line in slower:
+            print(line)
+        return 1 if slower else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
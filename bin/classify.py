@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`bin.classify`
+================================================================================
+
+Classify captured snapshots offline and write one JSON result per line
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Linux and Python 3.7 or Higher
+
+"""
+
+import argparse
+import json
+import sys
+from adafruit_platformdetect.batch import classify_source
+
+parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+parser.add_argument(
+    "source", help="directory of snapshot files, JSONL file, or - for stdin"
+)
+parser.add_argument(
+    "-o", "--output", default="-", help="JSONL file to write, default stdout"
+)
+parser.add_argument(
+    "-j", "--processes", type=int, default=None, help="worker processes"
+)
+parser.add_argument(
+    "--chunksize", type=int, default=64, help="snapshots sent to a worker at once"
+)
+
+
+def write_results(results, output):
+    """Write each result as a line of JSON, returning the number of errors"""
+    errors = 0
+    for result in results:
+        errors += "error" in result
+        output.write(json.dumps(result, separators=(",", ":")) + "\n")
+    return errors
+
+
+def main(args):
+    """Run the program"""
+    results = classify_source(args.source, args.processes, args.chunksize)
+    if args.output == "-":
+        errors = write_results(results, sys.stdout)
+    else:
+        with open(args.output, "w", encoding="utf-8") as output:
+            errors = write_results(results, output)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(parser.parse_args()))
@@ -21,10 +21,56 @@ Implementation Notes
 
 """
 
+import argparse
+import json
+import sys
 import adafruit_platformdetect
+from adafruit_platformdetect.board import FAMILY_NAMES
+from adafruit_platformdetect.trace import format_events
+
+parser = argparse.ArgumentParser(description="Board detection and determination script")
+parser.add_argument(
+    "--explain",
+    action="store_true",
+    help="list the rules evaluated, their inputs, results and timings",
+)
+parser.add_argument(
+    "--json",
+    action="store_true",
+    help="print the chip, board and board families as one JSON object",
+)
+args = parser.parse_args()
 
 detector = adafruit_platformdetect.Detector()
 
+
+def report():
+    """Return the chip, board and every board family flag"""
+    # Each result is cached by the detector, so this is a single detection
+    board = detector.board
+    families = board.families
+    return {
+        "chip_id": detector.chip.id,
+        "board_id": board.id,
+        "rev_code": board.rev_code,
+        "embedded_linux": board.any_embedded_linux,
+        "generic_linux": board.generic_linux,
+        "os_environ_board": board.os_environ_board,
+        "families": {name: name in families for name in sorted(FAMILY_NAMES)},
+    }
+
+
+if args.json:
+    print(json.dumps(report(), separators=(",", ":")))
+    sys.exit()
+
+if args.explain:
+    print(format_events(detector.explain()))
+    print()
+    print("Chip id: ", detector.chip.id)
+    print("Board id: ", detector.board.id)
+    sys.exit()
+
 print("Board Detection Test")
 print()
 print("Check that the Chip and Board IDs match your board and that this it is")
@@ -11,6 +11,14 @@
 Interactive mode will prompt for the revision code
 Otherwise it will be detected automatically
 
+Batch mode decodes the codes of a file, or ``-`` for stdin, one per line or
+from a column of a CSV file, and writes a CSV or JSONL row with every field
+for each. Codes that are not hexadecimal get a row with an ``error``, and
+the exit status is 1 once every code has been written::
+
+    python rpi_info.py --batch codes.txt
+    python rpi_info.py --batch devices.csv --column rev_code --format jsonl
+
 * Author(s): Melissa LeBlanc-Williams
 
 Implementation Notes
@@ -24,12 +32,22 @@ Implementation Notes
 
 import sys
 import argparse
+import csv
+import functools
+import io
+import json
 import adafruit_platformdetect
-from adafruit_platformdetect.revcodes import PiDecoder
+from adafruit_platformdetect.revcodes import FIELDS, PiDecoder, get_decoder
 
 detector = adafruit_platformdetect.Detector()
 parser = argparse.ArgumentParser()
 
+# Distinct codes whose rows batch mode keeps, enough for any fleet while
+# keeping memory bounded when every line is different
+BATCH_CACHE_SIZE = 4096
+
+BATCH_COLUMNS = ("line", "rev_code", "error", "valid", "new_format") + FIELDS
+
 
 def print_property(label, value):
     """Format and print a property"""
@@ -51,7 +69,7 @@ def main(interactive):
     print_property("Revision Code", pi_rev_code)
 
     try:
-        decoder = PiDecoder(pi_rev_code)
+        decoder = get_decoder(pi_rev_code)
     except ValueError:
         print("Invalid revision code. It should be a hexadecimal value.")
         sys.exit(1)
@@ -82,10 +100,97 @@ def main(interactive):
         print_property("Manufacturer", decoder.manufacturer)
 
 
+def iter_codes(lines, column=None):
+    """Return an iterator of ``(line number, code)`` for each code of ``lines``"""
+    if column is None:
+        return (
+            (number, line.strip())
+            for number, line in enumerate(lines, 1)
+            if line.strip()
+        )
+    reader = csv.DictReader(lines)
+    if column not in (reader.fieldnames or ()):
+        raise ValueError(f"No column {column!r} in the CSV header")
+    return (
+        (reader.line_num, row[column].strip())
+        for row in reader
+        if (row[column] or "").strip()
+    )
+
+
+@functools.lru_cache(maxsize=BATCH_CACHE_SIZE)
+def format_code(pi_rev_code, output_format):
+    """
+    Return the batch row of a code without its line number, and whether the
+    code is invalid. Each distinct code is only decoded and formatted once.
+    """
+    row = {"rev_code": pi_rev_code}
+    try:
+        decoder = PiDecoder(pi_rev_code)
+    except ValueError as error:
+        row["error"] = str(error)
+    else:
+        row["valid"] = decoder.is_valid_code()
+        row["new_format"] = decoder.is_new_format()
+        row.update(decoder.as_dict())
+    if output_format == "csv":
+        text = io.StringIO()
+        writer = csv.DictWriter(text, BATCH_COLUMNS[1:], lineterminator="\n")
+        writer.writerow(row)
+        return text.getvalue(), "error" in row
+    return json.dumps(row, separators=(",", ":"))[1:] + "\n", "error" in row
+
+
+def write_rows(codes, output, output_format):
+    """Write a CSV or JSONL row per code, returning the number of errors"""
+    if output_format == "csv":
+        output.write(",".join(BATCH_COLUMNS) + "\n")
+        start = "{},"
+    else:
+        start = '{{"line":{},'
+    errors = 0
+    for number, pi_rev_code in codes:
+        text, error = format_code(pi_rev_code, output_format)
+        errors += error
+        output.write(start.format(number) + text)
+    return errors
+
+
+def batch(source, column, output_format):
+    """Decode every code of ``source``, returning the exit status"""
+    if source == "-":
+        lines = sys.stdin
+    else:
+        lines = open(source, "r", encoding="utf-8", newline="")
+    with lines:
+        try:
+            codes = iter_codes(lines, column)
+        except ValueError as error:
+            print(error, file=sys.stderr)
+            return 2
+        errors = write_rows(codes, sys.stdout, output_format)
+    return 1 if errors else 0
+
+
 # Main function
 if __name__ == "__main__":
     parser.add_argument(
         "-i", "--interactive", help="Interactive Mode", action="store_true"
     )
+    parser.add_argument(
+        "-b", "--batch", metavar="FILE", help="decode every code of FILE, - for stdin"
+    )
+    parser.add_argument(
+        "-c", "--column", help="read the codes from this column of a CSV file"
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=("csv", "jsonl"),
+        default="csv",
+        help="batch output format",
+    )
     args = parser.parse_args()
+    if args.batch:
+        sys.exit(batch(args.batch, args.column, args.format))
     main(args.interactive)
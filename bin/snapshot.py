@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`bin.snapshot`
+================================================================================
+
+Capture the files and environment detection reads on this host, or replay
+a captured snapshot and print what it is detected as
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Linux and Python 3.7 or Higher
+
+"""
+
+import argparse
+import sys
+from adafruit_platformdetect.snapshot import Snapshot
+
+
+def capture(args):
+    """Record this host and write the snapshot"""
+    snapshot = Snapshot.capture(root=args.root)
+    if args.output == "-":
+        sys.stdout.buffer.write(snapshot.dumps())
+    else:
+        snapshot.save(args.output)
+        print(f"Captured {len(snapshot.files)} files to {args.output}")
+
+
+def replay(args):
+    """Detect the chip and board of a snapshot"""
+    snapshot = Snapshot.load(args.snapshot)
+    detector = snapshot.detector()
+    if args.list:
+        for path, data in sorted(snapshot.files.items()):
+            size = "missing" if data is None else f"{len(data)} bytes"
+            print(f"{path}: {size}")
+        for name, value in sorted(snapshot.environ.items()):
+            print(f"{name}={value}")
+    print("Chip id:", detector.chip.id)
+    print("Board id:", detector.board.id)
+
+
+parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+commands = parser.add_subparsers(dest="command")
+commands.required = True
+
+capture_parser = commands.add_parser("capture", help="record this host")
+capture_parser.add_argument("output", help="snapshot file to write, or - for stdout")
+capture_parser.add_argument(
+    "--root", default=None, help="read system files below this directory instead"
+)
+capture_parser.set_defaults(func=capture)
+
+replay_parser = commands.add_parser("replay", help="detect a captured host")
+replay_parser.add_argument("snapshot", help="snapshot file to read")
+replay_parser.add_argument(
+    "--list", action="store_true", help="also list the recorded inputs"
+)
+replay_parser.set_defaults(func=replay)
+
+if __name__ == "__main__":
+    arguments = parser.parse_args()
+    arguments.func(arguments)
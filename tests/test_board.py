@@ -0,0 +1,44 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Board families of a board forced through BLINKA_FORCEBOARD
+
+Run from the repository root::
+
+    python -m unittest discover -s tests
+
+"""
+
+import unittest
+
+from adafruit_platformdetect import Detector
+from adafruit_platformdetect.sysroot import MemoryFilesystem
+
+
+def _forced_board(board_id):
+    """Return the board of a Detector with no files and a forced board."""
+    environ = {"BLINKA_FORCEBOARD": board_id, "BLINKA_FORCECHIP": "BCM2XXX"}
+    return Detector(root=MemoryFilesystem({}), environ=environ).board
+
+
+class ForcedBoardFamiliesTest(unittest.TestCase):
+    """The any_* families of a forced board are answered without any I/O."""
+
+    def test_raspberry_pi_40_pin(self):
+        """A forced Pi 4B is a 40 pin Pi without reading /proc/cpuinfo."""
+        board = _forced_board("RASPBERRY_PI_4B")
+        self.assertTrue(board.any_raspberry_pi_40_pin)
+        self.assertTrue(board.any_raspberry_pi_4_board)
+        self.assertFalse(board.any_orange_pi)
+
+    def test_orange_pi(self):
+        """A forced Orange Pi PC is an Orange Pi."""
+        board = _forced_board("ORANGE_PI_PC")
+        self.assertTrue(board.any_orange_pi)
+        self.assertFalse(board.any_raspberry_pi_40_pin)
+
+
+if __name__ == "__main__":
+    unittest.main()
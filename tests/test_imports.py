@@ -0,0 +1,131 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Import time budget of the package
+
+Each check imports the package in a new interpreter, so earlier imports
+cannot hide a regression. Run from the repository root::
+
+    python -m unittest discover -s tests
+
+The modules keep the MicroPython-safe ``try: from typing import ...``
+idiom, so on CPython the import always loads :mod:`typing`, which loads
+:mod:`re` itself. The budget and the deferred modules are therefore those
+of the package's own modules, leaving out what importing :mod:`typing`
+alone costs and loads.
+
+"""
+
+import compileall
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+PACKAGE = "adafruit_platformdetect"
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Most microseconds the fastest of REPEAT imports may take, besides typing
+BUDGET_US = 10000
+REPEAT = 5
+
+# Modules only some detection paths need, which must be imported there
+DEFERRED = ("re", "glob", "tempfile", "json", "hid", "pyftdi", "usb", "numpy")
+
+# Prints the top-level modules loaded after importing the module given as
+# argument, and those the package's own code imported, loaded or not
+_MODULES_SCRIPT = """
+import builtins, json, sys
+_import = builtins.__import__
+imported = set()
+def _tracking(name, globals=None, locals=None, fromlist=(), level=0):
+    if level == 0 and (globals or {}).get("__name__", "").startswith(PACKAGE):
+        imported.add(name.partition(".")[0])
+    return _import(name, globals, locals, fromlist, level)
+builtins.__import__ = _tracking
+__import__(sys.argv[1])
+loaded = {name.partition(".")[0] for name in sys.modules}
+print(json.dumps({"loaded": sorted(loaded), "imported": sorted(imported)}))
+"""
+
+
+def _run(args):
+    """Return the completed process of the interpreter run with ``args``."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        path for path in (ROOT, env.get("PYTHONPATH")) if path
+    )
+    return subprocess.run(
+        [sys.executable] + args,
+        env=env,
+        check=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+
+
+def _importtime(module):
+    """Return ``{module: cumulative us}`` for one import of ``module``."""
+    stderr = _run(["-X", "importtime", "-c", "import " + module]).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative_us)
+    return times
+
+
+def _modules(module):
+    """Return the modules loaded by, and imported from the package for,
+    one import of ``module``."""
+    script = _MODULES_SCRIPT.replace("PACKAGE", repr(PACKAGE))
+    return json.loads(_run(["-c", script, module]).stdout)
+
+
+class ImportBudgetTest(unittest.TestCase):
+    """Importing the package stays fast and leaves deferred modules alone."""
+
+    @classmethod
+    def setUpClass(cls):
+        # Time loading cached bytecode, not compiling it
+        compileall.compile_dir(os.path.join(ROOT, PACKAGE), quiet=1)
+        cls.runs = [_importtime(PACKAGE) for _ in range(REPEAT)]
+        cls.modules = _modules(PACKAGE)
+        cls.typing_modules = _modules("typing")
+
+    def test_budget(self):
+        """The fastest import, besides typing, is within BUDGET_US."""
+        fastest = min(times[PACKAGE] - times.get("typing", 0) for times in self.runs)
+        self.assertLessEqual(
+            fastest,
+            BUDGET_US,
+            "import {} took {} us besides typing, over the budget of {} us".format(
+                PACKAGE, fastest, BUDGET_US
+            ),
+        )
+
+    def test_deferred_modules(self):
+        """No module of DEFERRED is imported by the package itself."""
+        for name in DEFERRED:
+            with self.subTest(module=name):
+                self.assertNotIn(
+                    name,
+                    self.modules["imported"],
+                    "{} imports {} at import time".format(PACKAGE, name),
+                )
+                if name not in self.typing_modules["loaded"]:
+                    self.assertNotIn(
+                        name,
+                        self.modules["loaded"],
+                        "import {} loads {}".format(PACKAGE, name),
+                    )
+
+
+if __name__ == "__main__":
+    unittest.main()
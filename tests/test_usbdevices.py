@@ -0,0 +1,48 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Listing USB devices through /sys/bus/usb/devices
+
+Run from the repository root::
+
+    python -m unittest discover -s tests
+
+"""
+
+import unittest
+
+from adafruit_platformdetect.sysroot import MemoryFilesystem
+from adafruit_platformdetect.usbdevices import UsbDevices
+
+
+class _DeniedFilesystem(MemoryFilesystem):
+    """A filesystem on which listing any directory is denied."""
+
+    def __init__(self, live):
+        super().__init__({})
+        self.live = live
+
+    def listdir(self, path):
+        raise PermissionError(13, "Permission denied", path)
+
+
+class SysfsTest(unittest.TestCase):
+    """An unreadable /sys/bus/usb/devices is treated like a missing one."""
+
+    def test_denied_live(self):
+        """The running system falls back to the USB libraries."""
+        self.assertIsNone(UsbDevices(_DeniedFilesystem(live=True)).sysfs())
+
+    def test_denied_offline(self):
+        """Any other system has no USB devices."""
+        self.assertEqual(UsbDevices(_DeniedFilesystem(live=False)).sysfs(), {})
+
+    def test_missing_offline(self):
+        """Without the directory an offline system has no USB devices."""
+        self.assertEqual(UsbDevices(MemoryFilesystem({})).sysfs(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()